@@ -0,0 +1,6 @@
+#!/bin/sh
+set -e
+
+export PYTHONPATH="/app:${PYTHONPATH}"
+
+exec python -m src.entrypoints.outbox_relay
@@ -1,5 +1,6 @@
 import abc
 import datetime
+import uuid
 
 
 class ABCTimeProvider(abc.ABC):
@@ -7,3 +8,18 @@ class ABCTimeProvider(abc.ABC):
     def now(self) -> datetime.datetime:
         """Возвращает текущее время в UTC."""
         raise NotImplementedError
+
+
+class ABCFailedLoginCounter(abc.ABC):
+    @abc.abstractmethod
+    async def increment(self, user_id: uuid.UUID, ttl: datetime.timedelta) -> int:
+        """Атомарно увеличивает счётчик неудачных входов и возвращает новое значение.
+
+        Счётчик создаётся со сроком жизни ``ttl``; повторные вызовы срок не продлевают.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def reset(self, user_id: uuid.UUID) -> None:
+        """Сбрасывает счётчик неудачных входов пользователя."""
+        raise NotImplementedError
@@ -0,0 +1,4 @@
+class FailedLoginCounterError(Exception):
+    """Хранилище счётчика неудачных входов недоступно."""
+
+    pass
@@ -1,5 +1,8 @@
+from collections.abc import Sequence
 from typing import Any, Protocol
 
+from src.domain.model import OutboxEvent
+
 
 class ISecretsProvider(Protocol):
     """Контракт для любого хранилища секретов."""
@@ -36,3 +39,28 @@ class IPasswordHasher(Protocol):
 
         """
         ...
+
+    def is_valid_hash(self, hashed_password: str) -> bool:
+        """Проверить, что строка является хэшем, который умеет проверять хэшер.
+
+        Args:
+            hashed_password: Предполагаемый хэш пароля
+
+        Returns:
+            True, если хэш распознан, False в ином случае
+
+        """
+        ...
+
+
+class IOutboxDispatcher(Protocol):
+    """Контракт быстрой публикации outbox-событий сразу после коммита."""
+
+    def dispatch(self, events: Sequence[OutboxEvent]) -> None:
+        """Передать закоммиченные события на публикацию, не дожидаясь её.
+
+        Args:
+            events: События, добавленные в outbox закоммиченной транзакцией
+
+        """
+        ...
@@ -30,3 +30,15 @@ class Argon2PasswordHasher(IPasswordHasher):
 
         """
         return argon2.hash(password)
+
+    def is_valid_hash(self, hashed_password: str) -> bool:
+        """Проверяет, что строка является Argon2-хешем.
+
+        Args:
+            hashed_password: Предполагаемый хеш пароля.
+
+        Returns:
+            True, если хеш распознан как Argon2, иначе False.
+
+        """
+        return argon2.identify(hashed_password)
@@ -0,0 +1,38 @@
+import datetime
+import math
+import uuid
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.adapters.abc_classes import ABCFailedLoginCounter
+from src.adapters.exceptions.login_counter_exceptions import FailedLoginCounterError
+
+
+class RedisFailedLoginCounter(ABCFailedLoginCounter):
+    """Счётчик неудачных входов в Redis вместо записи в ``user_auth_state`` на каждую ошибку."""
+
+    def __init__(self, client: Redis, key_prefix: str = 'users:failed-logins:') -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def _key(self, user_id: uuid.UUID) -> str:
+        return f'{self._key_prefix}{user_id}'
+
+    async def increment(self, user_id: uuid.UUID, ttl: datetime.timedelta) -> int:
+        key = self._key(user_id)
+        try:
+            # SET NX EX задаёт срок жизни только новому ключу, INCR его сохраняет.
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.set(key, 0, nx=True, ex=max(math.ceil(ttl.total_seconds()), 1))
+                pipe.incr(key)
+                _, attempts = await pipe.execute()
+        except RedisError as exc:
+            raise FailedLoginCounterError(str(exc)) from exc
+        return int(attempts)
+
+    async def reset(self, user_id: uuid.UUID) -> None:
+        try:
+            await self._client.delete(self._key(user_id))
+        except RedisError as exc:
+            raise FailedLoginCounterError(str(exc)) from exc
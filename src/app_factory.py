@@ -12,7 +12,7 @@ from src.infrastructure.lifespan import lifespan
 from src.infrastructure.logging.logger import configure_logging
 from src.infrastructure.middleware.cors import setup_cors
 from src.infrastructure.middleware.request_context import setup_request_context
-from src.interfaces.api import endpoints
+from src.interfaces.api import admin_endpoints, endpoints, internal_endpoints, metrics_endpoints
 from src.interfaces.api.exception_handlers import setup_exception_handlers
 
 logger = logging.getLogger(__name__)
@@ -47,4 +47,7 @@ def create_app(*args, **kwargs) -> FastAPI:
     setup_cors(app)
     setup_exception_handlers(app)
     app.include_router(endpoints.router)
+    app.include_router(admin_endpoints.router)
+    app.include_router(internal_endpoints.router)
+    app.include_router(metrics_endpoints.router)
     return app
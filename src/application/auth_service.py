@@ -2,8 +2,9 @@ import logging
 import uuid
 from datetime import UTC, datetime, timedelta
 
-from src.adapters.abc_classes import ABCTimeProvider
+from src.adapters.abc_classes import ABCFailedLoginCounter, ABCTimeProvider
 from src.adapters.auth.jwt_backend import JwtTokenAdapter
+from src.adapters.exceptions.login_counter_exceptions import FailedLoginCounterError
 from src.adapters.interfaces import IPasswordHasher
 from src.application.uow import AbstractUnitOfWork
 from src.domain.exceptions.exceptions import (
@@ -30,12 +31,16 @@ class JWTAuthService:
         hasher: IPasswordHasher,
         max_attempts: int,
         lock_time: timedelta,
+        failed_login_counter: ABCFailedLoginCounter | None = None,
+        failed_login_window: timedelta = timedelta(days=1),
     ):
         self._jwt = jwt_backend
         self._time_provider = time_provider
         self._hasher = hasher
         self.max_attempts = max_attempts
         self.lock_time = lock_time
+        self._failed_login_counter = failed_login_counter
+        self.failed_login_window = failed_login_window
 
     async def _get_or_create_auth_state(
         self,
@@ -53,6 +58,66 @@ class JWTAuthService:
             await uow.user_auth_state.create(auth_state)
         return auth_state
 
+    async def _register_failed_attempt(
+        self,
+        uow: AbstractUnitOfWork,
+        auth_state: UserAuthState,
+        now: datetime,
+    ) -> int:
+        """Учитывает неудачный вход и возвращает число оставшихся попыток.
+
+        Если доступен счётчик в Redis, попытки считаются там, а в БД пишется
+        только блокировка; иначе состояние сохраняется в БД на каждую попытку.
+        """
+        counter_attempts: int | None = None
+        if self._failed_login_counter is not None:
+            try:
+                counter_attempts = await self._failed_login_counter.increment(
+                    auth_state.user_id,
+                    self.failed_login_window,
+                )
+            except FailedLoginCounterError:
+                logger.warning(
+                    'Счётчик неудачных входов недоступен, используется БД user_id=%s',
+                    auth_state.user_id,
+                )
+
+        if counter_attempts is None:
+            try:
+                return self._apply_failed_attempt(auth_state, now)
+            finally:
+                await uow.user_auth_state.save(auth_state)
+
+        lock_expired = auth_state.locked_until is not None and auth_state.locked_until <= now
+        # Доменная модель сама увеличивает счётчик, поэтому передаём ей предыдущее значение.
+        auth_state.failed_attempts = counter_attempts - 1
+        try:
+            remaining = self._apply_failed_attempt(auth_state, now)
+        except MaxLoginAttemptsExceeded:
+            await uow.user_auth_state.save(auth_state)
+            await self._reset_failed_login_counter(auth_state.user_id)
+            raise
+        if lock_expired:
+            # Истёкшую блокировку снимаем в БД один раз, а не на каждой следующей попытке.
+            await uow.user_auth_state.save(auth_state)
+        return remaining
+
+    def _apply_failed_attempt(self, auth_state: UserAuthState, now: datetime) -> int:
+        return auth_state.register_failed_attempt(
+            now=now,
+            max_attempts=self.max_attempts,
+            base_lock_time=self.lock_time,
+            max_lock_time=timedelta(days=14),
+        )
+
+    async def _reset_failed_login_counter(self, user_id: uuid.UUID) -> None:
+        if self._failed_login_counter is None:
+            return
+        try:
+            await self._failed_login_counter.reset(user_id)
+        except FailedLoginCounterError:
+            logger.warning('Не удалось сбросить счётчик неудачных входов user_id=%s', user_id)
+
     async def create_token_pair(
         self,
         uow: AbstractUnitOfWork,
@@ -265,22 +330,12 @@ class JWTAuthService:
             raise UserLockedError(retry_after=auth_state.locked_until - now)
 
         if not self._hasher.verify_password(password, user.hashed_password):
-            try:
-                remaining = auth_state.register_failed_attempt(
-                    now=now,
-                    max_attempts=self.max_attempts,
-                    base_lock_time=self.lock_time,
-                    max_lock_time=timedelta(days=14),
-                )
-            except MaxLoginAttemptsExceeded:
-                await uow.user_auth_state.save(auth_state)
-                raise
-
-            await uow.user_auth_state.save(auth_state)
+            remaining = await self._register_failed_attempt(uow, auth_state, now)
             raise InvalidCredentialsError(remaining_attempts=remaining)
 
         auth_state.register_success(now)
         user.update_last_login_time(now)
+        await self._reset_failed_login_counter(user.id)
 
         await uow.user_auth_state.save(auth_state)
         await uow.users.update(user)
@@ -0,0 +1,27 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from src.application.exceptions import InvalidCursorError
+
+KeysetPosition = tuple[datetime, uuid.UUID]
+
+
+def encode_keyset_cursor(position: KeysetPosition) -> str:
+    """Encode a ``(timestamp, id)`` keyset position into an opaque URL-safe token."""
+    timestamp, row_id = position
+    raw = f'{timestamp.isoformat()}|{row_id}'.encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_keyset_cursor(cursor: str) -> KeysetPosition:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        timestamp, row_id = raw.split('|', 1)
+        position = (datetime.fromisoformat(timestamp), uuid.UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError() from exc
+    if position[0].tzinfo is None:
+        raise InvalidCursorError()
+    return position
@@ -1,19 +1,25 @@
 import logging
 from datetime import timedelta
-from typing import AsyncIterator
 
-from httpx import AsyncClient
-
-from src.adapters.abc_classes import ABCTimeProvider
+from src.adapters.abc_classes import ABCFailedLoginCounter, ABCTimeProvider
 from src.adapters.auth.jwt_backend import JwtTokenAdapter
 from src.adapters.interfaces import IPasswordHasher
 from src.adapters.password_hasher import Argon2PasswordHasher
+from src.adapters.redis_login_counter import RedisFailedLoginCounter
 from src.adapters.time_provider import UtcTimeProvider
 from src.application.auth_service import JWTAuthService
+from src.application.outbox_monitor import OutboxMonitor
+from src.application.outbox_retention import OutboxRetentionService
 from src.application.uow import AbstractUnitOfWork, SqlAlchemyUnitOfWork
+from src.application.user_admin_service import UserAdminService
+from src.application.user_export import UserExportService
+from src.application.user_import import UserImportService
 from src.application.user_service import UserService
 from src.config.settings import get_settings
-from src.infrastructure.clients.subscriptions import SubscriptionsClient
+from src.infrastructure.clients.subscriptions import (
+    SubscriptionsClient,
+    get_shared_subscriptions_client,
+)
 from src.infrastructure.database.engine import get_session_factory
 from src.infrastructure.database.repository.factory import (
     ABCEmailVerificationTokenRepositoryFactory,
@@ -27,6 +33,8 @@ from src.infrastructure.database.repository.factory import (
     SqlAlchemyOutboxEventRepositoryFactory,
     SqlAlchemyUserAuthStateRepositoryFactory,
 )
+from src.infrastructure.messaging.rabbit import get_outbox_dispatcher
+from src.infrastructure.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,7 @@ async def get_uow() -> AbstractUnitOfWork:
         user_auth_state_repo_factory=await get_user_auth_state_repo_factory(),
         email_verification_token_repo_factory=await get_email_verification_token_repo_factory(),
         outbox_event_repo_factory=await get_outbox_event_repo_factory(),
+        outbox_dispatcher=get_outbox_dispatcher(),
     )
 
 
@@ -91,21 +100,22 @@ async def get_email_verification_token_repo_factory() -> ABCEmailVerificationTok
 
 
 async def get_outbox_event_repo_factory() -> ABCOutboxEventRepositoryFactory:
-    return SqlAlchemyOutboxEventRepositoryFactory()
+    dispatcher = get_outbox_dispatcher()
+    return SqlAlchemyOutboxEventRepositoryFactory(
+        dispatch_grace=dispatcher.grace if dispatcher is not None else None,
+    )
 
 
-async def get_subscriptions_client() -> AsyncIterator[SubscriptionsClient]:
-    settings = get_settings()
-    base_url = settings.SUBSCRIPTIONS_SERVICE_URL
-    if not base_url:
-        yield SubscriptionsClient(http_client=None)
-        return
+async def get_subscriptions_client() -> SubscriptionsClient:
+    return get_shared_subscriptions_client() or SubscriptionsClient(http_client=None)
+
 
-    async with AsyncClient(
-        base_url=base_url.rstrip('/'),
-        timeout=5.0,
-    ) as http_client:
-        yield SubscriptionsClient(http_client=http_client)
+async def get_failed_login_counter() -> ABCFailedLoginCounter | None:
+    """Return the Redis failed-login counter, or ``None`` to count in the database."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    return RedisFailedLoginCounter(redis)
 
 
 async def get_auth_service() -> JWTAuthService:
@@ -116,6 +126,8 @@ async def get_auth_service() -> JWTAuthService:
         hasher=await get_hasher(),
         max_attempts=settings.MAX_LOGIN_ATTEMPTS,
         lock_time=timedelta(minutes=settings.LOGIN_LOCK_MINUTES),
+        failed_login_counter=await get_failed_login_counter(),
+        failed_login_window=timedelta(minutes=settings.FAILED_LOGIN_WINDOW_MINUTES),
     )
 
 
@@ -130,3 +142,52 @@ async def get_user_service() -> UserService:
         frontend_base_url=settings.FRONTEND_BASE_URL,
         rabbitmq_exchange=settings.RABBITMQ_EXCHANGE,
     )
+
+
+async def get_user_import_service() -> UserImportService:
+    settings = get_settings()
+    return UserImportService(
+        uow=await get_uow(),
+        hasher=await get_hasher(),
+        time_provider=await get_time_provider(),
+        chunk_size=settings.USER_IMPORT_CHUNK_SIZE,
+        max_reported_errors=settings.USER_IMPORT_MAX_REPORTED_ERRORS,
+        max_csv_record_length=settings.USER_IMPORT_MAX_CSV_RECORD_LENGTH,
+    )
+
+
+async def get_user_export_service() -> UserExportService:
+    settings = get_settings()
+    return UserExportService(
+        uow=await get_uow(),
+        batch_size=settings.USER_EXPORT_BATCH_SIZE,
+    )
+
+
+async def get_user_admin_service() -> UserAdminService:
+    settings = get_settings()
+    return UserAdminService(
+        uow=await get_uow(),
+        time_provider=await get_time_provider(),
+        change_feed_settle_delay=timedelta(seconds=settings.USERS_CHANGE_FEED_SETTLE_SECONDS),
+    )
+
+
+async def get_outbox_monitor() -> OutboxMonitor:
+    settings = get_settings()
+    return OutboxMonitor(
+        uow=await get_uow(),
+        time_provider=await get_time_provider(),
+        lag_threshold=timedelta(seconds=settings.OUTBOX_LAG_WARNING_SECONDS),
+        max_sample_age=timedelta(seconds=settings.OUTBOX_MONITOR_INTERVAL_SECONDS * 3),
+    )
+
+
+async def get_outbox_retention_service() -> OutboxRetentionService:
+    settings = get_settings()
+    return OutboxRetentionService(
+        uow=await get_uow(),
+        time_provider=await get_time_provider(),
+        retention=timedelta(days=settings.OUTBOX_RETENTION_DAYS),
+        batch_size=settings.OUTBOX_RETENTION_BATCH_SIZE,
+    )
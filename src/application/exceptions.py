@@ -1 +1,8 @@
 """Application exceptions module for the users service."""
+
+from src.domain.exceptions.exceptions import DomainError
+
+
+class InvalidCursorError(DomainError):
+    code = 'INVALID_CURSOR'
+    message = 'Pagination cursor is invalid'
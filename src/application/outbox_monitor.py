@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from src.adapters.abc_classes import ABCTimeProvider
+from src.application.uow import AbstractUnitOfWork
+from src.infrastructure.messaging.outbox_metrics import (
+    OUTBOX_DEFERRED_EVENTS,
+    OUTBOX_OLDEST_DUE_AGE,
+    OUTBOX_PENDING_EVENTS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxHealth:
+    pending: int
+    deferred: int
+    lag_seconds: float
+    is_lagging: bool
+    sampled_at: datetime
+
+
+_latest_health: OutboxHealth | None = None
+
+
+class OutboxMonitor:
+    """Sample the outbox backlog into the backlog gauges and a per-process cache.
+
+    Sampling counts the pending rows, so it runs on the ``OutboxMonitorWorker``
+    schedule; health checks and scrapes only read the cached sample. Lag is
+    measured over due events only, so retries waiting out their backoff do not
+    flag a healthy relay as lagging.
+    """
+
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        time_provider: ABCTimeProvider,
+        lag_threshold: timedelta = timedelta(minutes=5),
+        max_sample_age: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self.uow = uow
+        self.time_provider = time_provider
+        self.lag_threshold = lag_threshold
+        self.max_sample_age = max_sample_age
+
+    async def check(self) -> OutboxHealth:
+        global _latest_health
+        now = self.time_provider.now()
+        async with self.uow as uow:
+            backlog = await uow.outbox_events.pending_stats(now)
+
+        lag = backlog.lag(now)
+        OUTBOX_PENDING_EVENTS.set(backlog.pending)
+        OUTBOX_DEFERRED_EVENTS.set(backlog.deferred)
+        OUTBOX_OLDEST_DUE_AGE.set(lag.total_seconds())
+        _latest_health = OutboxHealth(
+            pending=backlog.pending,
+            deferred=backlog.deferred,
+            lag_seconds=lag.total_seconds(),
+            is_lagging=lag > self.lag_threshold,
+            sampled_at=now,
+        )
+        return _latest_health
+
+    def latest(self) -> OutboxHealth | None:
+        """Return the last sample taken in this process unless it is older than ``max_sample_age``."""
+        health = _latest_health
+        if health is None or self.time_provider.now() - health.sampled_at > self.max_sample_age:
+            return None
+        return health
+
+
+class OutboxMonitorWorker:
+    def __init__(self, monitor: OutboxMonitor, interval_seconds: float = 15.0) -> None:
+        self._monitor = monitor
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name='users-outbox-monitor')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self._monitor.check()
+            except Exception:  # noqa: BLE001
+                logger.exception('Failed to sample outbox backlog')
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self._interval_seconds)
+            except TimeoutError:
+                continue
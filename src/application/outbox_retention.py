@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from src.adapters.abc_classes import ABCTimeProvider
+from src.application.uow import AbstractUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRetentionService:
+    """Delete published outbox events older than the retention window."""
+
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        time_provider: ABCTimeProvider,
+        retention: timedelta = timedelta(days=7),
+        batch_size: int = 1000,
+    ) -> None:
+        self.uow = uow
+        self.time_provider = time_provider
+        self.retention = retention
+        self.batch_size = batch_size
+
+    async def purge(self) -> int:
+        """Delete expired events one short ``batch_size`` transaction at a time."""
+        cutoff = self.time_provider.now() - self.retention
+        total = 0
+        while True:
+            async with self.uow as uow:
+                deleted = await uow.outbox_events.delete_published_before(cutoff, self.batch_size)
+            total += deleted
+            if deleted < self.batch_size:
+                break
+            await asyncio.sleep(0)
+        if total:
+            logger.info('Purged %s published outbox events older than %s', total, cutoff.isoformat())
+        return total
+
+
+class OutboxRetentionWorker:
+    def __init__(self, service: OutboxRetentionService, interval_seconds: float = 3600.0) -> None:
+        self._service = service
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name='users-outbox-retention')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self._service.purge()
+            except Exception:  # noqa: BLE001
+                logger.exception('Outbox retention purge failed')
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self._interval_seconds)
+            except TimeoutError:
+                continue
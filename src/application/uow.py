@@ -1,8 +1,13 @@
 import abc
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.adapters.interfaces import IOutboxDispatcher
 from src.domain.exceptions.exceptions import EmailAlreadyRegisteredError, UsernameAlreadyTakenError
 from src.infrastructure.database.repository.abc import (
     ABCUsersRepository,
@@ -19,6 +24,13 @@ from src.infrastructure.database.repository.factory import (
     ABCUsersRepositoryFactory,
 )
 
+logger = logging.getLogger(__name__)
+
+TransactionCallback = Callable[[], Awaitable[None] | None]
+
+# Strong references keep scheduled callbacks from being garbage collected mid-flight.
+_background_tasks: set[asyncio.Future] = set()
+
 
 class AbstractUnitOfWork(abc.ABC):
     users: ABCUsersRepository
@@ -27,21 +39,56 @@ class AbstractUnitOfWork(abc.ABC):
     email_verification_tokens: AbstractEmailVerificationTokenRepository
     outbox_events: AbstractOutboxEventRepository
 
+    def __init__(self) -> None:
+        self._on_commit: list[TransactionCallback] = []
+        self._on_rollback: list[TransactionCallback] = []
+
     async def __aenter__(self) -> 'AbstractUnitOfWork':
+        self._on_commit = []
+        self._on_rollback = []
         return self
 
     async def __aexit__(self, *args) -> None:
         await self.rollback()
 
+    def on_commit(self, callback: TransactionCallback) -> None:
+        """Run ``callback`` once the current transaction has committed.
+
+        Callbacks run after the commit returns, without delaying the caller:
+        coroutine results are scheduled as background tasks. They must not use
+        this unit of work's session.
+        """
+        self._on_commit.append(callback)
+
+    def on_rollback(self, callback: TransactionCallback) -> None:
+        """Run ``callback`` if the current transaction is rolled back or fails to commit."""
+        self._on_rollback.append(callback)
+
     async def commit(self) -> None:
-        await self._commit()
+        try:
+            await self._commit()
+        except BaseException:
+            self._run_callbacks(self._on_rollback)
+            raise
+        self._run_callbacks(self._on_commit)
+
+    async def rollback(self) -> None:
+        await self._rollback()
+        self._run_callbacks(self._on_rollback)
+
+    def _run_callbacks(self, callbacks: list[TransactionCallback]) -> None:
+        pending = list(callbacks)
+        self._on_commit.clear()
+        self._on_rollback.clear()
+        for callback in pending:
+            _run_in_background(callback)
 
     @abc.abstractmethod
     async def _commit(self) -> None:
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def rollback(self) -> None:
+    async def _rollback(self) -> None:
         raise NotImplementedError
 
 
@@ -60,13 +107,16 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         user_auth_state_repo_factory: ABCUserAuthStateRepositoryFactory,
         email_verification_token_repo_factory: ABCEmailVerificationTokenRepositoryFactory,
         outbox_event_repo_factory: ABCOutboxEventRepositoryFactory,
+        outbox_dispatcher: IOutboxDispatcher | None = None,
     ) -> None:
+        super().__init__()
         self.session_factory = session_factory
         self.repo_factory = repo_factory
         self._refresh_token_repo_factory = refresh_token_repo_factory
         self._user_auth_state_repo_factory = user_auth_state_repo_factory
         self._email_verification_token_repo_factory = email_verification_token_repo_factory
         self._outbox_event_repo_factory = outbox_event_repo_factory
+        self._outbox_dispatcher = outbox_dispatcher
 
     async def __aenter__(self) -> 'SqlAlchemyUnitOfWork':
         self.session: AsyncSession = self.session_factory()
@@ -78,11 +128,13 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         return await super().__aenter__()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if exc_type:
-            await self.rollback()
-        else:
-            await self._commit()
-        await self.session.close()
+        try:
+            if exc_type:
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
+            await self.session.close()
 
     async def _commit(self) -> None:
         try:
@@ -90,6 +142,10 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         except IntegrityError as exc:
             self._handle_integrity_error(exc)
             raise
+        added_events = self.outbox_events.pop_added()
+        if added_events and self._outbox_dispatcher is not None:
+            dispatcher = self._outbox_dispatcher
+            self.on_commit(lambda: dispatcher.dispatch(added_events))
 
     def _handle_integrity_error(self, exc: IntegrityError):
         msg = str(exc.orig)
@@ -98,5 +154,24 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
                 raise error_cls()
         raise exc
 
-    async def rollback(self) -> None:
+    async def _rollback(self) -> None:
         await self.session.rollback()
+        self.outbox_events.pop_added()
+
+
+def _run_in_background(callback: TransactionCallback) -> None:
+    try:
+        result = callback()
+    except Exception:  # noqa: BLE001
+        logger.exception('Unit of work callback %r failed', callback)
+        return
+    if inspect.isawaitable(result):
+        task = asyncio.ensure_future(result)
+        _background_tasks.add(task)
+        task.add_done_callback(_on_background_task_done)
+
+
+def _on_background_task_done(task: asyncio.Future) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error('Unit of work callback failed', exc_info=task.exception())
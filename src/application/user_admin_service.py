@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+from src.adapters.abc_classes import ABCTimeProvider
+from src.application.cursors import decode_keyset_cursor, encode_keyset_cursor
+from src.application.uow import AbstractUnitOfWork
+from src.domain.model import User
+from src.schemas.internal.pagination import Page
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_change import UserTombstone, change_position
+
+
+class UserAdminService:
+    """Read-side queries over users for support staff and downstream services."""
+
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        time_provider: ABCTimeProvider,
+        change_feed_settle_delay: timedelta = timedelta(seconds=5),
+    ) -> None:
+        self.uow = uow
+        self.time_provider = time_provider
+        self.change_feed_settle_delay = change_feed_settle_delay
+
+    async def list_users(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        is_verified: bool | None = None,
+        is_disabled: bool | None = None,
+        role: UserRole | None = None,
+    ) -> Page[User]:
+        before = decode_keyset_cursor(cursor) if cursor else None
+        async with self.uow as uow:
+            items = await uow.users.list_page(
+                limit=limit + 1,
+                before=before,
+                is_verified=is_verified,
+                is_disabled=is_disabled,
+                role=role,
+            )
+
+        if len(items) <= limit:
+            return Page(items=items)
+
+        items = items[:limit]
+        last = items[-1]
+        return Page(items=items, next_cursor=encode_keyset_cursor((last.created_at, last.id)))
+
+    async def list_changes(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[Page[User | UserTombstone], bool]:
+        """Return users changed or deleted after ``cursor`` and whether more changes are available.
+
+        Rows younger than the settle delay are held back so that transactions which took their
+        ``updated_at`` earlier but committed later are not skipped by the resume cursor.
+        """
+        after = decode_keyset_cursor(cursor) if cursor else None
+        until = self.time_provider.now() - self.change_feed_settle_delay
+        async with self.uow as uow:
+            items = await uow.users.list_changed(limit=limit + 1, until=until, after=after)
+
+        has_more = len(items) > limit
+        items = items[:limit]
+        if not items:
+            return Page(items=[], next_cursor=cursor), False
+
+        next_cursor = encode_keyset_cursor(change_position(items[-1]))
+        return Page(items=items, next_cursor=next_cursor), has_more
+
+    async def search_users(self, query: str, limit: int) -> list[User]:
+        async with self.uow as uow:
+            return await uow.users.search(query.strip(), limit)
@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.application.uow import AbstractUnitOfWork
+from src.domain.model import User
+from src.schemas.internal.user_import import UserDataFormat
+
+EXPORT_FIELDS = (
+    'id',
+    'first_name',
+    'last_name',
+    'email',
+    'username',
+    'role',
+    'is_verified',
+    'is_disabled',
+    'created_at',
+    'updated_at',
+    'last_login_at',
+)
+EXPORT_MEDIA_TYPES = {
+    UserDataFormat.CSV: 'text/csv',
+    UserDataFormat.NDJSON: 'application/x-ndjson',
+}
+
+
+class UserExportService:
+    """Constant-memory export of the users table as CSV or NDJSON."""
+
+    def __init__(self, uow: AbstractUnitOfWork, batch_size: int = 1000) -> None:
+        self.uow = uow
+        self.batch_size = batch_size
+
+    async def export(self, export_format: UserDataFormat) -> AsyncIterator[bytes]:
+        """Yield the encoded export one ``batch_size`` block of rows at a time."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        rows_in_buffer = 0
+
+        if export_format is UserDataFormat.CSV:
+            writer.writerow(EXPORT_FIELDS)
+
+        async with self.uow as uow:
+            async for user in uow.users.stream_all(self.batch_size):
+                row = _export_row(user)
+                if export_format is UserDataFormat.CSV:
+                    writer.writerow('' if value is None else value for value in row.values())
+                else:
+                    buffer.write(json.dumps(row, ensure_ascii=False))
+                    buffer.write('\n')
+
+                rows_in_buffer += 1
+                if rows_in_buffer >= self.batch_size:
+                    yield buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    rows_in_buffer = 0
+
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+
+def _export_row(user: User) -> dict[str, Any]:
+    return {
+        'id': str(user.id),
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'email': user.email,
+        'username': user.username,
+        'role': user.role.value,
+        'is_verified': user.is_verified,
+        'is_disabled': user.is_disabled,
+        'created_at': _isoformat(user.created_at),
+        'updated_at': _isoformat(user.updated_at),
+        'last_login_at': _isoformat(user.last_login_at),
+    }
+
+
+def _isoformat(value) -> str | None:
+    return value.isoformat() if value is not None else None
@@ -0,0 +1,302 @@
+import codecs
+import collections
+import csv
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from src.adapters.abc_classes import ABCTimeProvider
+from src.adapters.interfaces import IPasswordHasher
+from src.application.uow import AbstractUnitOfWork
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_import import (
+    UserDataFormat,
+    UserImportErrorReason,
+    UserImportRecord,
+    UserImportReport,
+    UserImportRowError,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_IMPORT_FIELDS = ('first_name', 'last_name', 'email', 'username', 'hashed_password')
+_TRUE_VALUES = frozenset({'1', 'true', 't', 'yes', 'y'})
+_FALSE_VALUES = frozenset({'', '0', 'false', 'f', 'no', 'n'})
+
+
+class InvalidImportRowError(ValueError):
+    def __init__(self, message: str, field: str | None = None) -> None:
+        super().__init__(message)
+        self.field = field
+
+
+async def iter_text_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 byte chunks into lines without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    tail = ''
+    async for chunk in chunks:
+        tail += decoder.decode(chunk)
+        *lines, tail = tail.split('\n')
+        for line in lines:
+            yield line.rstrip('\r')
+    tail += decoder.decode(b'', final=True)
+    if tail:
+        yield tail.rstrip('\r')
+
+
+class _PendingLines:
+    """Lines handed to one long-lived ``csv.reader`` as they arrive from the stream."""
+
+    def __init__(self) -> None:
+        self.lines: collections.deque[str] = collections.deque()
+
+    def __iter__(self) -> '_PendingLines':
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def iter_csv_rows(
+    lines: AsyncIterable[str],
+    max_record_length: int = 1 << 16,
+) -> AsyncIterator[tuple[int, list[str] | InvalidImportRowError]]:
+    """Yield ``(line_no, values)`` for each CSV record, including quoted multi-line fields.
+
+    A single reader parses the whole stream; lines are buffered only while a quoted
+    field is still open, so the reader never runs dry in the middle of a record.
+    A record still open after ``max_record_length`` characters (usually a stray
+    quote) is dropped and yielded as an error, and parsing resumes on the next line.
+    """
+    pending = _PendingLines()
+    reader = csv.reader(pending)
+    open_quotes = 0
+    pending_length = 0
+    dropped_lines = 0
+
+    async for line in lines:
+        pending.lines.append(line + '\n')
+        open_quotes += line.count('"')
+        pending_length += len(line) + 1
+        if open_quotes % 2:
+            if pending_length > max_record_length:
+                line_no = reader.line_num + dropped_lines + 1
+                dropped_lines += len(pending.lines)
+                pending.lines.clear()
+                open_quotes = pending_length = 0
+                yield line_no, InvalidImportRowError(
+                    f'Quoted field is not closed within {max_record_length} characters',
+                )
+            continue
+        open_quotes = pending_length = 0
+        while pending.lines:
+            line_no = reader.line_num + dropped_lines + 1
+            yield line_no, next(reader)
+
+    while pending.lines:
+        line_no = reader.line_num + dropped_lines + 1
+        yield line_no, next(reader)
+
+
+async def _numbered(lines: AsyncIterable[str]) -> AsyncIterator[tuple[int, str]]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        yield line_no, line
+
+
+async def iter_file_chunks(path: str, chunk_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    with open(path, 'rb') as source:
+        while chunk := source.read(chunk_size):
+            yield chunk
+
+
+class UserImportService:
+    """Bulk import of pre-hashed users streamed as CSV or NDJSON."""
+
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        hasher: IPasswordHasher,
+        time_provider: ABCTimeProvider,
+        chunk_size: int = 5000,
+        max_reported_errors: int | None = None,
+        max_csv_record_length: int = 1 << 16,
+    ) -> None:
+        self.uow = uow
+        self.hasher = hasher
+        self.time_provider = time_provider
+        self.chunk_size = chunk_size
+        self.max_reported_errors = max_reported_errors
+        self.max_csv_record_length = max_csv_record_length
+
+    async def import_stream(
+        self,
+        lines: AsyncIterable[str],
+        import_format: UserDataFormat,
+    ) -> UserImportReport:
+        report = UserImportReport()
+        chunk: list[UserImportRecord] = []
+
+        async for item in self._parse(lines, import_format):
+            if isinstance(item, UserImportRowError):
+                self._reject(report, [item])
+                continue
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                await self._flush(report, chunk)
+                chunk = []
+
+        if chunk:
+            await self._flush(report, chunk)
+
+        logger.info(
+            'User import finished imported=%s rejected=%s',
+            report.imported,
+            report.rejected,
+        )
+        return report
+
+    async def _flush(self, report: UserImportReport, chunk: list[UserImportRecord]) -> None:
+        async with self.uow as uow:
+            errors = await uow.users.import_many(chunk)
+            await uow.commit()
+
+        rejected_lines = {error.line_no for error in errors}
+        report.imported += len(chunk) - len(rejected_lines)
+        self._reject(report, errors)
+
+    def _reject(self, report: UserImportReport, errors: list[UserImportRowError]) -> None:
+        report.rejected += len({error.line_no for error in errors})
+        limit = self.max_reported_errors
+        for error in errors:
+            if limit is not None and len(report.errors) >= limit:
+                report.errors_truncated = True
+                return
+            report.errors.append(error)
+
+    async def _parse(
+        self,
+        lines: AsyncIterable[str],
+        import_format: UserDataFormat,
+    ) -> AsyncIterator[UserImportRecord | UserImportRowError]:
+        header: list[str] | None = None
+        rows: AsyncIterator[tuple[int, str | list[str] | InvalidImportRowError]] = (
+            _numbered(lines)
+            if import_format is UserDataFormat.NDJSON
+            else iter_csv_rows(lines, self.max_csv_record_length)
+        )
+
+        async for line_no, row in rows:
+            try:
+                if isinstance(row, InvalidImportRowError):
+                    raise row
+                if isinstance(row, str):
+                    if not row.strip():
+                        continue
+                    data = _parse_json_object(row)
+                else:
+                    if not any(value.strip() for value in row):
+                        continue
+                    if header is None:
+                        header = [value.strip() for value in row]
+                        continue
+                    if len(row) != len(header):
+                        raise InvalidImportRowError(
+                            f'Expected {len(header)} columns, got {len(row)}',
+                        )
+                    data = dict(zip(header, row, strict=True))
+                yield self._to_record(line_no, data)
+            except InvalidImportRowError as exc:
+                yield UserImportRowError(
+                    line_no=line_no,
+                    reason=UserImportErrorReason.INVALID_ROW,
+                    field=exc.field,
+                    message=str(exc),
+                )
+            except ValueError as exc:
+                yield UserImportRowError(
+                    line_no=line_no,
+                    reason=UserImportErrorReason.INVALID_ROW,
+                    message=str(exc),
+                )
+
+    def _to_record(self, line_no: int, data: dict[str, Any]) -> UserImportRecord:
+        for field in REQUIRED_IMPORT_FIELDS:
+            value = data.get(field)
+            if not isinstance(value, str) or not value.strip():
+                raise InvalidImportRowError(f'Field "{field}" is required', field=field)
+
+        hashed_password = data['hashed_password'].strip()
+        if not self.hasher.is_valid_hash(hashed_password):
+            raise InvalidImportRowError('Unsupported password hash', field='hashed_password')
+
+        return UserImportRecord(
+            line_no=line_no,
+            id=_parse_uuid(data.get('id')),
+            first_name=data['first_name'].strip(),
+            last_name=data['last_name'].strip(),
+            email=data['email'].lower().strip(),
+            username=data['username'].strip(),
+            hashed_password=hashed_password,
+            role=_parse_role(data.get('role')),
+            is_verified=_parse_bool(data.get('is_verified'), field='is_verified'),
+            is_disabled=_parse_bool(data.get('is_disabled'), field='is_disabled'),
+            created_at=_parse_datetime(data.get('created_at')) or self.time_provider.now(),
+        )
+
+
+def _parse_json_object(line: str) -> dict[str, Any]:
+    data = json.loads(line)
+    if not isinstance(data, dict):
+        raise InvalidImportRowError('Expected a JSON object')
+    return data
+
+
+def _parse_uuid(value: Any) -> uuid.UUID:
+    if value is None or value == '':
+        return uuid.uuid4()
+    try:
+        return uuid.UUID(str(value))
+    except ValueError as exc:
+        raise InvalidImportRowError('Invalid UUID', field='id') from exc
+
+
+def _parse_role(value: Any) -> UserRole:
+    if value is None or value == '':
+        return UserRole.USER
+    normalized = str(value).strip().lower()
+    try:
+        return UserRole(normalized)
+    except ValueError as exc:
+        raise InvalidImportRowError(f'Unknown role "{value}"', field='role') from exc
+
+
+def _parse_bool(value: Any, *, field: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value is None:
+        return False
+    normalized = str(value).strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise InvalidImportRowError(f'Invalid boolean "{value}"', field=field)
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    if value is None or value == '':
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError as exc:
+        raise InvalidImportRowError('Invalid ISO 8601 datetime', field='created_at') from exc
+    if parsed.tzinfo is None:
+        raise InvalidImportRowError('Datetime must include a timezone', field='created_at')
+    return parsed
@@ -1,7 +1,8 @@
-import json
 import uuid
 from datetime import timedelta
 
+import orjson
+
 from src.adapters.abc_classes import ABCTimeProvider
 from src.adapters.interfaces import IPasswordHasher
 from src.application.auth_service import JWTAuthService
@@ -112,7 +113,7 @@ class UserService:
             id=uuid.uuid4(),
             event_type='user.email_verification_requested',
             routing_key='notifications.email.verification.requested',
-            payload=json.dumps(
+            payload=orjson.dumps(
                 {
                     'event_id': str(uuid.uuid4()),
                     'event_type': 'user.email_verification_requested',
@@ -128,6 +129,7 @@ class UserService:
                 },
             ),
             created_at=now,
+            ordering_key=f'user:{user.id}',
         )
         await uow.outbox_events.add(event)
         return raw_token
@@ -211,19 +211,40 @@ class OutboxEvent:
     id: uuid.UUID
     event_type: str
     routing_key: str
-    payload: str
+    payload: bytes
     created_at: datetime.datetime
     published_at: datetime.datetime | None = None
     error_message: str | None = None
     attempts: int = 0
+    next_attempt_at: datetime.datetime | None = None
+    # Events sharing a key are published in ``created_at`` order; ``None`` is unordered.
+    ordering_key: str | None = None
 
     def mark_published(self, now: datetime.datetime) -> None:
         self.published_at = now
         self.error_message = None
 
-    def mark_failed(self, error_message: str) -> None:
+    def mark_failed(
+        self,
+        error_message: str,
+        now: datetime.datetime,
+        *,
+        base_delay: datetime.timedelta,
+        max_delay: datetime.timedelta,
+    ) -> None:
+        """Record a failed delivery and schedule the retry with exponential backoff."""
         self.attempts += 1
         self.error_message = error_message
+        delay = min(base_delay * 2 ** min(self.attempts - 1, 32), max_delay)
+        self.next_attempt_at = now + delay
+
+    def defer(self, until: datetime.datetime, reason: str) -> None:
+        """Postpone delivery without spending an attempt, e.g. behind a failed predecessor."""
+        self.next_attempt_at = until
+        self.error_message = reason
+
+    def is_exhausted(self, max_attempts: int) -> bool:
+        return self.attempts >= max_attempts
 
 
 def ensure_token_hash(token_hash: str) -> None:
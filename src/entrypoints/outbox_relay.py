@@ -0,0 +1,69 @@
+"""Standalone worker that relays outbox events to RabbitMQ.
+
+Run it next to the API with ``OUTBOX_RELAY_IN_PROCESS=false`` set for the API
+workers, so relay and API capacity can be scaled independently:
+
+    python -m src.entrypoints.outbox_relay
+"""
+
+import asyncio
+import logging
+import signal
+
+from prometheus_client import start_http_server
+
+from src.app_factory import bootstrap
+from src.application.dependencies import get_outbox_monitor, get_outbox_retention_service
+from src.application.outbox_monitor import OutboxMonitorWorker
+from src.application.outbox_retention import OutboxRetentionWorker
+from src.config.settings import get_settings
+from src.infrastructure.database.engine import get_engine
+from src.infrastructure.messaging.rabbit import create_outbox_relay_supervisor
+
+logger = logging.getLogger(__name__)
+
+
+async def _run() -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    settings = get_settings()
+    metrics_server = None
+    if settings.OUTBOX_RELAY_METRICS_PORT:
+        metrics_server, _ = start_http_server(settings.OUTBOX_RELAY_METRICS_PORT)
+        logger.info('Serving relay metrics on port %s', settings.OUTBOX_RELAY_METRICS_PORT)
+
+    supervisor = create_outbox_relay_supervisor()
+    await supervisor.start()
+    retention_worker = OutboxRetentionWorker(
+        await get_outbox_retention_service(),
+        interval_seconds=settings.OUTBOX_RETENTION_INTERVAL_SECONDS,
+    )
+    await retention_worker.start()
+    monitor_worker = OutboxMonitorWorker(
+        await get_outbox_monitor(),
+        interval_seconds=settings.OUTBOX_MONITOR_INTERVAL_SECONDS,
+    )
+    await monitor_worker.start()
+    logger.info('Outbox relay worker started')
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info('Outbox relay worker stopping')
+        await monitor_worker.stop()
+        await retention_worker.stop()
+        await supervisor.stop()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        await get_engine().dispose()
+
+
+def main() -> None:
+    bootstrap()
+    asyncio.run(_run())
+
+
+if __name__ == '__main__':
+    main()
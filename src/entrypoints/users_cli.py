@@ -0,0 +1,121 @@
+"""Command line entrypoint for bulk maintenance of the users table.
+
+Usage:
+    python -m src.entrypoints.users_cli import users.ndjson --format ndjson
+    python -m src.entrypoints.users_cli export users.csv --format csv
+    python -m src.entrypoints.users_cli purge-outbox --retention-days 7
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from datetime import timedelta
+
+from src.app_factory import bootstrap
+from src.application.dependencies import (
+    get_outbox_retention_service,
+    get_user_export_service,
+    get_user_import_service,
+)
+from src.application.user_import import iter_file_chunks, iter_text_lines
+from src.infrastructure.database.engine import get_engine
+from src.schemas.internal.user_import import UserDataFormat
+
+
+async def _import_users(args: argparse.Namespace) -> int:
+    service = await get_user_import_service()
+    service.max_reported_errors = None
+    if args.chunk_size:
+        service.chunk_size = args.chunk_size
+
+    report = await service.import_stream(
+        iter_text_lines(iter_file_chunks(args.path)),
+        UserDataFormat(args.format),
+    )
+    for error in report.errors:
+        print(json.dumps(asdict(error), default=str), file=sys.stderr)
+    print(json.dumps({'imported': report.imported, 'rejected': report.rejected}))
+    return 0 if report.rejected == 0 else 1
+
+
+async def _export_users(args: argparse.Namespace) -> int:
+    service = await get_user_export_service()
+    if args.batch_size:
+        service.batch_size = args.batch_size
+
+    export_format = UserDataFormat(args.format)
+    if args.path == '-':
+        async for chunk in service.export(export_format):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return 0
+
+    with open(args.path, 'wb') as target:
+        async for chunk in service.export(export_format):
+            target.write(chunk)
+    return 0
+
+
+async def _purge_outbox(args: argparse.Namespace) -> int:
+    service = await get_outbox_retention_service()
+    if args.retention_days is not None:
+        service.retention = timedelta(days=args.retention_days)
+    if args.batch_size:
+        service.batch_size = args.batch_size
+
+    deleted = await service.purge()
+    print(json.dumps({'deleted': deleted}))
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='users_cli', description='eebook-users maintenance commands')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help='Bulk import users with pre-hashed passwords')
+    import_parser.add_argument('path', help='Path to a CSV or NDJSON file')
+    import_parser.add_argument(
+        '--format',
+        choices=[item.value for item in UserDataFormat],
+        default=UserDataFormat.NDJSON.value,
+    )
+    import_parser.add_argument('--chunk-size', type=int, default=None)
+    import_parser.set_defaults(handler=_import_users)
+
+    export_parser = commands.add_parser('export', help='Stream all users to a CSV or NDJSON file')
+    export_parser.add_argument('path', help='Output path, "-" for stdout')
+    export_parser.add_argument(
+        '--format',
+        choices=[item.value for item in UserDataFormat],
+        default=UserDataFormat.NDJSON.value,
+    )
+    export_parser.add_argument('--batch-size', type=int, default=None)
+    export_parser.set_defaults(handler=_export_users)
+
+    purge_parser = commands.add_parser(
+        'purge-outbox',
+        help='Delete published outbox events older than the retention window',
+    )
+    purge_parser.add_argument('--retention-days', type=int, default=None)
+    purge_parser.add_argument('--batch-size', type=int, default=None)
+    purge_parser.set_defaults(handler=_purge_outbox)
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> int:
+    try:
+        return await args.handler(args)
+    finally:
+        await get_engine().dispose()
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    bootstrap()
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import enum
+import time
+from collections.abc import Callable
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Fail fast after ``failure_threshold`` consecutive failures.
+
+    Once open, calls are rejected for ``reset_timeout_seconds``; then the breaker
+    half-opens and lets one trial call through per ``reset_timeout_seconds``
+    until a call succeeds (closed again) or fails (open again).
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._next_trial_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._clock() >= self._next_trial_at:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        if self._state is CircuitState.CLOSED:
+            return True
+        now = self._clock()
+        if now < self._next_trial_at:
+            return False
+        # A trial that never reports back does not block the next one forever.
+        self._state = CircuitState.HALF_OPEN
+        self._next_trial_at = now + self._reset_timeout_seconds
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._state = CircuitState.OPEN
+            self._next_trial_at = self._clock() + self._reset_timeout_seconds
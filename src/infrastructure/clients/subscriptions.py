@@ -1,48 +1,432 @@
+import asyncio
 import logging
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
 
-from httpx import AsyncClient, HTTPError, HTTPStatusError
+import orjson
+from httpx import (
+    AsyncClient,
+    AsyncHTTPTransport,
+    HTTPError,
+    HTTPStatusError,
+    Limits,
+    PoolTimeout,
+    Response,
+    Timeout,
+)
+from prometheus_client import Counter, Gauge, Histogram
 from pydantic import ValidationError
 
+from src.config.settings import get_settings
+from src.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitState
 from src.interfaces.api.schemas import UserSubscriptionSchema
 
 logger = logging.getLogger(__name__)
 
+SUBSCRIPTIONS_REQUEST_DURATION = Histogram(
+    'subscriptions_request_duration_seconds',
+    'Subscriptions service lookups by outcome.',
+    labelnames=('outcome',),
+)
+SUBSCRIPTIONS_BATCH_REQUEST_DURATION = Histogram(
+    'subscriptions_batch_request_duration_seconds',
+    'Bulk subscriptions service lookups by outcome.',
+    labelnames=('outcome',),
+)
+SUBSCRIPTIONS_REQUESTS_IN_FLIGHT = Gauge(
+    'subscriptions_requests_in_flight',
+    'Subscriptions service requests waiting for a pooled connection or a response.',
+)
+SUBSCRIPTIONS_CACHE_LOOKUPS = Counter(
+    'subscriptions_cache_lookups_total',
+    'Subscription cache lookups by result (hit, stale, miss).',
+    labelnames=('result',),
+)
+SUBSCRIPTIONS_CACHE_ENTRIES = Gauge(
+    'subscriptions_cache_entries',
+    'Subscriptions currently held in the lookup cache.',
+)
+SUBSCRIPTIONS_CIRCUIT_REJECTIONS = Counter(
+    'subscriptions_circuit_rejections_total',
+    'Subscription lookups failed fast because the circuit breaker is open.',
+)
+SUBSCRIPTIONS_CIRCUIT_STATE = Gauge(
+    'subscriptions_circuit_state',
+    'Subscriptions circuit breaker state: 0 closed, 1 half-open, 2 open.',
+)
+
+_CIRCUIT_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+_subscriptions_client: 'SubscriptionsClient | None' = None
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    subscription: UserSubscriptionSchema | None
+    fresh_until: float
+    stale_until: float
+
 
 class SubscriptionsClient:
-    """HTTP client for the subscriptions microservice."""
+    """HTTP client for the subscriptions microservice.
+
+    Lookups are cached per user: fresh entries are served directly, stale ones
+    are served while a background task refreshes them. 404s are cached for
+    ``negative_ttl_seconds``; failed lookups are never cached. Concurrent
+    lookups for one user share a single request, and ``circuit_breaker`` turns
+    lookups into immediate misses while the service keeps failing.
+    """
 
-    def __init__(self, http_client: AsyncClient | None) -> None:
+    def __init__(
+        self,
+        http_client: AsyncClient | None,
+        *,
+        ttl_seconds: float = 60.0,
+        stale_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        max_entries: int = 10_000,
+        max_entry_bytes: int = 16_384,
+        batch_size: int = 100,
+        circuit_breaker: CircuitBreaker | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._http_client = http_client
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._max_entries = max_entries
+        self._max_entry_bytes = max_entry_bytes
+        self._batch_size = batch_size
+        self._clock = clock
+        self._cache: OrderedDict[uuid.UUID, _CacheEntry] = OrderedDict()
+        self._inflight: dict[uuid.UUID, asyncio.Task] = {}
+        self._batch_refreshes: set[asyncio.Task] = set()
+        # Bumped on every invalidation so lookups that started earlier do not cache old data.
+        self._epoch = 0
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._cache)
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        return self._circuit_breaker.state
 
     async def get_by_user_id(self, user_id: uuid.UUID) -> UserSubscriptionSchema | None:
         if self._http_client is None:
             return None
 
+        entry = self._cached(user_id, self._clock())
+        if entry is not None:
+            return entry.subscription
+        # Shielded: one caller giving up must not cancel the lookup the others wait for.
+        return await asyncio.shield(self._start_load(user_id))
+
+    async def get_by_user_ids(
+        self,
+        user_ids: Iterable[uuid.UUID],
+    ) -> dict[uuid.UUID, UserSubscriptionSchema | None]:
+        """Look up many users at once; cache misses are fetched with bulk requests."""
+        unique_ids = list(dict.fromkeys(user_ids))
+        if self._http_client is None:
+            return dict.fromkeys(unique_ids)
+
+        now = self._clock()
+        subscriptions: dict[uuid.UUID, UserSubscriptionSchema | None] = {}
+        missing: list[uuid.UUID] = []
+        for user_id in unique_ids:
+            entry = self._cached(user_id, now, refresh_stale=False)
+            if entry is None:
+                missing.append(user_id)
+            else:
+                subscriptions[user_id] = entry.subscription
+
+        stale = [
+            user_id
+            for user_id in subscriptions
+            if now >= self._cache[user_id].fresh_until and user_id not in self._inflight
+        ]
+        if stale:
+            task = asyncio.create_task(self._load_many(stale), name='subscriptions-batch-refresh')
+            self._batch_refreshes.add(task)
+            task.add_done_callback(self._batch_refreshes.discard)
+        if missing:
+            subscriptions.update(await self._load_many(missing))
+        return {user_id: subscriptions.get(user_id) for user_id in unique_ids}
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self._epoch += 1
+        self._cache.pop(user_id, None)
+
+    def update(self, user_id: uuid.UUID, subscription: UserSubscriptionSchema | None) -> None:
+        """Replace the cached lookup with a snapshot pushed by the subscriptions service."""
+        self._epoch += 1
+        self._store(user_id, subscription)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._cache.clear()
+
+    async def aclose(self) -> None:
+        inflight = [*self._inflight.values(), *self._batch_refreshes]
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        self._cache.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    def _cached(
+        self,
+        user_id: uuid.UUID,
+        now: float,
+        *,
+        refresh_stale: bool = True,
+    ) -> _CacheEntry | None:
+        """Return the usable cache entry for ``user_id``, or ``None`` on a miss."""
+        entry = self._cache.get(user_id)
+        if entry is None or now >= entry.stale_until:
+            SUBSCRIPTIONS_CACHE_LOOKUPS.labels(result='miss').inc()
+            return None
+        self._cache.move_to_end(user_id)
+        if now < entry.fresh_until:
+            SUBSCRIPTIONS_CACHE_LOOKUPS.labels(result='hit').inc()
+        else:
+            SUBSCRIPTIONS_CACHE_LOOKUPS.labels(result='stale').inc()
+            if refresh_stale:
+                self._start_load(user_id)
+        return entry
+
+    def _start_load(self, user_id: uuid.UUID) -> asyncio.Task:
+        """Return the in-flight lookup for ``user_id``, starting one if there is none."""
+        task = self._inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(self._load(user_id), name=f'subscriptions-lookup-{user_id}')
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(user_id, None))
+        return task
+
+    async def _load(self, user_id: uuid.UUID) -> UserSubscriptionSchema | None:
+        epoch = self._epoch
+        found, subscription, size = await self._fetch(user_id)
+        if found is None:
+            # The service could not answer; keep whatever is cached for the next lookup.
+            return subscription
+        if epoch == self._epoch and size <= self._max_entry_bytes:
+            self._store(user_id, subscription if found else None)
+        return subscription
+
+    async def _load_many(
+        self,
+        user_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, UserSubscriptionSchema | None]:
+        epoch = self._epoch
+        chunks = [
+            user_ids[start : start + self._batch_size]
+            for start in range(0, len(user_ids), self._batch_size)
+        ]
+        results = await asyncio.gather(*(self._fetch_many(chunk) for chunk in chunks))
+
+        subscriptions: dict[uuid.UUID, UserSubscriptionSchema | None] = dict.fromkeys(user_ids)
+        for chunk, found in zip(chunks, results, strict=True):
+            if found is None:
+                continue
+            for user_id in chunk:
+                # Users missing from a successful bulk response have no subscription.
+                subscription, size = found.get(user_id, (None, 0))
+                subscriptions[user_id] = subscription
+                if epoch == self._epoch and size <= self._max_entry_bytes:
+                    self._store(user_id, subscription)
+        return subscriptions
+
+    def _store(self, user_id: uuid.UUID, subscription: UserSubscriptionSchema | None) -> None:
+        now = self._clock()
+        ttl = self._ttl_seconds if subscription is not None else self._negative_ttl_seconds
+        self._cache[user_id] = _CacheEntry(
+            subscription=subscription,
+            fresh_until=now + ttl,
+            stale_until=now + ttl + self._stale_seconds,
+        )
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    async def _fetch(
+        self,
+        user_id: uuid.UUID,
+    ) -> tuple[bool | None, UserSubscriptionSchema | None, int]:
+        """Return ``(found, subscription, body size)``; ``found`` is ``None`` on failure."""
+        response = await self._send(
+            'GET',
+            f'/api/v1/subscriptions/users/{user_id}',
+            duration=SUBSCRIPTIONS_REQUEST_DURATION,
+            log_extra={'user_id': str(user_id)},
+        )
+        if response is None:
+            return None, None, 0
+        if response.status_code == 404:
+            return False, None, 0
+
         try:
-            response = await self._http_client.get(f'/api/v1/subscriptions/users/{user_id}')
+            payload = response.json()
+            subscription = UserSubscriptionSchema.model_validate(payload)
+        except (ValueError, ValidationError) as exc:
+            logger.warning(
+                'Subscriptions service returned invalid payload',
+                extra={'user_id': str(user_id), 'error': str(exc)},
+            )
+            return None, None, 0
+        return True, subscription, len(response.content)
+
+    async def _fetch_many(
+        self,
+        user_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, tuple[UserSubscriptionSchema, int]] | None:
+        """Map users that have a subscription to ``(subscription, size)``; ``None`` on failure."""
+        response = await self._send(
+            'POST',
+            '/api/v1/subscriptions/users/batch',
+            duration=SUBSCRIPTIONS_BATCH_REQUEST_DURATION,
+            log_extra={'user_count': len(user_ids)},
+            json={'user_ids': [str(user_id) for user_id in user_ids]},
+        )
+        if response is None or response.status_code == 404:
+            return None
+
+        try:
+            found: dict[uuid.UUID, tuple[UserSubscriptionSchema, int]] = {}
+            for item in response.json():
+                subscription = UserSubscriptionSchema.model_validate(item)
+                found[uuid.UUID(subscription.user_id)] = (subscription, len(orjson.dumps(item)))
+        except (ValueError, TypeError, ValidationError) as exc:
+            logger.warning(
+                'Subscriptions service returned invalid batch payload',
+                extra={'user_count': len(user_ids), 'error': str(exc)},
+            )
+            return None
+        return found
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        duration: Histogram,
+        log_extra: dict[str, object],
+        **kwargs: Any,
+    ) -> Response | None:
+        """Send a request through the circuit breaker; ``None`` if rejected or failed.
+
+        404 responses are returned, every other error status is logged and dropped.
+        Requests that time out waiting for a pooled connection are measured with
+        the ``pool_timeout`` outcome and do not count against the circuit breaker.
+        """
+        # Callers return early for a disabled client.
+        assert self._http_client is not None
+        if not self._circuit_breaker.allow_request():
+            SUBSCRIPTIONS_CIRCUIT_REJECTIONS.inc()
+            return None
+
+        started = time.perf_counter()
+        outcome = 'ok'
+        try:
+            with SUBSCRIPTIONS_REQUESTS_IN_FLIGHT.track_inprogress():
+                response = await self._http_client.request(method, url, **kwargs)
             response.raise_for_status()
         except HTTPStatusError as exc:
+            if exc.response.status_code >= 500:
+                self._circuit_breaker.record_failure()
+            else:
+                self._circuit_breaker.record_success()
             if exc.response.status_code == 404:
-                return None
+                outcome = 'not_found'
+                return exc.response
+            outcome = 'error'
             logger.warning(
                 'Subscriptions service returned unexpected status',
-                extra={'user_id': str(user_id), 'status_code': exc.response.status_code},
+                extra={**log_extra, 'status_code': exc.response.status_code},
             )
             return None
+        except PoolTimeout:
+            outcome = 'pool_timeout'
+            logger.warning('Subscriptions HTTP connection pool is exhausted', extra=log_extra)
+            return None
         except HTTPError as exc:
+            outcome = 'unavailable'
+            self._circuit_breaker.record_failure()
             logger.warning(
                 'Subscriptions service is unavailable',
-                extra={'user_id': str(user_id), 'error': str(exc)},
+                extra={**log_extra, 'error': str(exc)},
             )
             return None
+        finally:
+            duration.labels(outcome=outcome).observe(time.perf_counter() - started)
 
-        try:
-            payload = response.json()
-            return UserSubscriptionSchema.model_validate(payload)
-        except (ValueError, ValidationError) as exc:
-            logger.warning(
-                'Subscriptions service returned invalid payload',
-                extra={'user_id': str(user_id), 'error': str(exc)},
-            )
-            return None
+        self._circuit_breaker.record_success()
+        return response
+
+
+def init_subscriptions_client() -> SubscriptionsClient | None:
+    """Create the pooled, caching client shared by all requests; ``None`` without a URL."""
+    global _subscriptions_client
+    if _subscriptions_client is not None:
+        raise RuntimeError('Subscriptions client already initialized')
+
+    settings = get_settings()
+    if not settings.SUBSCRIPTIONS_SERVICE_URL:
+        return None
+
+    transport = AsyncHTTPTransport(
+        limits=Limits(
+            max_connections=settings.SUBSCRIPTIONS_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUBSCRIPTIONS_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SUBSCRIPTIONS_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        http2=settings.SUBSCRIPTIONS_HTTP2,
+    )
+    http_client = AsyncClient(
+        base_url=settings.SUBSCRIPTIONS_SERVICE_URL.rstrip('/'),
+        transport=transport,
+        timeout=Timeout(
+            settings.SUBSCRIPTIONS_TIMEOUT_SECONDS,
+            connect=settings.SUBSCRIPTIONS_CONNECT_TIMEOUT_SECONDS,
+            pool=settings.SUBSCRIPTIONS_POOL_TIMEOUT_SECONDS,
+        ),
+    )
+    client = SubscriptionsClient(
+        http_client,
+        ttl_seconds=settings.SUBSCRIPTIONS_CACHE_TTL_SECONDS,
+        stale_seconds=settings.SUBSCRIPTIONS_CACHE_STALE_SECONDS,
+        negative_ttl_seconds=settings.SUBSCRIPTIONS_CACHE_NEGATIVE_TTL_SECONDS,
+        max_entries=settings.SUBSCRIPTIONS_CACHE_MAX_ENTRIES,
+        max_entry_bytes=settings.SUBSCRIPTIONS_CACHE_MAX_ENTRY_BYTES,
+        batch_size=settings.SUBSCRIPTIONS_BATCH_SIZE,
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=settings.SUBSCRIPTIONS_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout_seconds=settings.SUBSCRIPTIONS_CIRCUIT_RESET_SECONDS,
+        ),
+    )
+    SUBSCRIPTIONS_CACHE_ENTRIES.set_function(lambda: client.cache_size)
+    SUBSCRIPTIONS_CIRCUIT_STATE.set_function(lambda: _CIRCUIT_STATE_VALUES[client.circuit_state])
+    _subscriptions_client = client
+    return client
+
+
+def get_shared_subscriptions_client() -> SubscriptionsClient | None:
+    return _subscriptions_client
+
+
+async def close_subscriptions_client() -> None:
+    global _subscriptions_client
+    if _subscriptions_client is not None:
+        await _subscriptions_client.aclose()
+        _subscriptions_client = None
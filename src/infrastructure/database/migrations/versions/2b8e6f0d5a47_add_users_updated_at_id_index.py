@@ -0,0 +1,32 @@
+"""add users (updated_at, id) index for the change feed
+
+Revision ID: 2b8e6f0d5a47
+Revises: 9e4f1a7c3d25
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8e6f0d5a47'
+down_revision: Union[str, Sequence[str], None] = '9e4f1a7c3d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_updated_at_id',
+            'users',
+            ['updated_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_updated_at_id', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,59 @@
+"""add outbox retry schedule and dead letters
+
+Revision ID: 7a3c9d1e5f60
+Revises: 2b8e6f0d5a47
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3c9d1e5f60'
+down_revision: Union[str, Sequence[str], None] = '2b8e6f0d5a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'outbox_events',
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute('UPDATE outbox_events SET next_attempt_at = coalesce(created_at, now())')
+    op.alter_column(
+        'outbox_events',
+        'next_attempt_at',
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+    op.create_index(
+        'ix_outbox_events_pending_next_attempt_at',
+        'outbox_events',
+        ['next_attempt_at'],
+        postgresql_where=sa.text('published_at IS NULL'),
+    )
+
+    op.create_table(
+        'outbox_dead_letters',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('event_type', sa.String(), nullable=False),
+        sa.Column('routing_key', sa.String(), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('dead_lettered_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_outbox_dead_letters_dead_lettered_at', 'outbox_dead_letters', ['dead_lettered_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_dead_letters_dead_lettered_at', table_name='outbox_dead_letters')
+    op.drop_table('outbox_dead_letters')
+
+    op.drop_index('ix_outbox_events_pending_next_attempt_at', table_name='outbox_events')
+    op.drop_column('outbox_events', 'next_attempt_at')
@@ -0,0 +1,60 @@
+"""replace users trigram GIN indexes with GiST for nearest-neighbour search
+
+Revision ID: a3f5c8e1d7b2
+Revises: d9a1f7c3b2e4
+Create Date: 2026-10-19 19:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f5c8e1d7b2'
+down_revision: Union[str, Sequence[str], None] = 'd9a1f7c3b2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ('email', 'username')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.create_index(
+                f'ix_users_{column}_trgm_gist',
+                'users',
+                [column],
+                postgresql_using='gist',
+                postgresql_ops={column: 'gist_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for column in COLUMNS:
+            op.drop_index(
+                f'ix_users_{column}_trgm',
+                table_name='users',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.create_index(
+                f'ix_users_{column}_trgm',
+                'users',
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for column in COLUMNS:
+            op.drop_index(
+                f'ix_users_{column}_trgm_gist',
+                table_name='users',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,36 @@
+"""add user_tombstones for deletions in the users change feed
+
+Revision ID: b7e2d4a9c1f3
+Revises: a3f5c8e1d7b2
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a9c1f3'
+down_revision: Union[str, Sequence[str], None] = 'a3f5c8e1d7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_tombstones',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    op.create_index(
+        'ix_user_tombstones_deleted_at_user_id',
+        'user_tombstones',
+        ['deleted_at', 'user_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_tombstones_deleted_at_user_id', table_name='user_tombstones')
+    op.drop_table('user_tombstones')
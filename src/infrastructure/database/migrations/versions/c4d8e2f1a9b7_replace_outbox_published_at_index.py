@@ -0,0 +1,52 @@
+"""replace outbox published_at index with a partial pending index
+
+Revision ID: c4d8e2f1a9b7
+Revises: 7a3c9d1e5f60
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8e2f1a9b7'
+down_revision: Union[str, Sequence[str], None] = '7a3c9d1e5f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_events_pending_created_at',
+            'outbox_events',
+            ['created_at'],
+            postgresql_where=sa.text('published_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_outbox_events_published_at',
+            table_name='outbox_events',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_events_published_at',
+            'outbox_events',
+            ['published_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_outbox_events_pending_created_at',
+            table_name='outbox_events',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
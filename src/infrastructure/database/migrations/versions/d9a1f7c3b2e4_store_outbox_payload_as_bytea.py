@@ -0,0 +1,32 @@
+"""store outbox payloads as bytea
+
+Revision ID: d9a1f7c3b2e4
+Revises: c4d8e2f1a9b7
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a1f7c3b2e4'
+down_revision: Union[str, Sequence[str], None] = 'c4d8e2f1a9b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('outbox_events', 'outbox_dead_letters')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN payload TYPE bytea USING convert_to(payload, 'UTF8')",
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN payload TYPE text USING convert_from(payload, 'UTF8')",
+        )
@@ -0,0 +1,51 @@
+"""add outbox_events.ordering_key so the relay can keep per-user order across batches
+
+Revision ID: e5c9a2f7b8d1
+Revises: b7e2d4a9c1f3
+Create Date: 2026-10-19 21:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c9a2f7b8d1'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d4a9c1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_events', sa.Column('ordering_key', sa.String(), nullable=True))
+    # Pending events were written before the column existed; every one of them
+    # carries the user id the relay used to order by.
+    op.execute(
+        """
+        UPDATE outbox_events
+        SET ordering_key = 'user:' || (convert_from(payload, 'UTF8')::jsonb #>> '{payload,user_id}')
+        WHERE published_at IS NULL
+          AND convert_from(payload, 'UTF8')::jsonb #>> '{payload,user_id}' IS NOT NULL
+        """,
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_events_pending_ordering_key_created_at',
+            'outbox_events',
+            ['ordering_key', 'created_at'],
+            postgresql_where=sa.text('published_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_outbox_events_pending_ordering_key_created_at',
+            table_name='outbox_events',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('outbox_events', 'ordering_key')
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotificationListener:
+    """Keep a dedicated connection LISTENing on a channel and report every NOTIFY.
+
+    The connection is re-established after failures; ``on_notification`` is also
+    called after every (re)connect because notifications sent while the listener
+    was down are lost.
+    """
+
+    def __init__(
+        self,
+        *,
+        dsn: str,
+        channel: str,
+        on_notification: Callable[[], None],
+        reconnect_delay_seconds: float = 5.0,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._on_notification = on_notification
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name=f'pg-listen-{self._channel}')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    def _notify(self, *args) -> None:
+        self._on_notification()
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            connection: asyncpg.Connection | None = None
+            lost = asyncio.Event()
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                connection.add_termination_listener(lambda *_, lost=lost: lost.set())
+                await connection.add_listener(self._channel, self._notify)
+                logger.info('Listening for PostgreSQL notifications channel=%s', self._channel)
+                self._on_notification()
+
+                stop_waiter = asyncio.create_task(self._stop_event.wait())
+                lost_waiter = asyncio.create_task(lost.wait())
+                try:
+                    await asyncio.wait({stop_waiter, lost_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    stop_waiter.cancel()
+                    lost_waiter.cancel()
+                if lost.is_set():
+                    logger.warning('PostgreSQL notification connection lost channel=%s', self._channel)
+            except Exception:  # noqa: BLE001
+                logger.exception('PostgreSQL notification listener failed channel=%s', self._channel)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    try:
+                        await connection.close(timeout=self._reconnect_delay_seconds)
+                    except Exception:  # noqa: BLE001
+                        connection.terminate()
+
+            if not self._stop_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(),
+                        timeout=self._reconnect_delay_seconds,
+                    )
+                except TimeoutError:
+                    continue
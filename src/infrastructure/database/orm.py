@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     MetaData,
     String,
     Table,
@@ -38,6 +39,28 @@ users = Table(
     Column('created_at', DateTime(timezone=True), server_default=func.now()),
     Column('updated_at', DateTime(timezone=True), server_default=func.now()),
     Column('last_login_at', DateTime(timezone=True), nullable=True),
+    Index('ix_users_created_at_id', 'created_at', 'id'),
+    Index('ix_users_updated_at_id', 'updated_at', 'id'),
+    Index(
+        'ix_users_email_trgm_gist',
+        'email',
+        postgresql_using='gist',
+        postgresql_ops={'email': 'gist_trgm_ops'},
+    ),
+    Index(
+        'ix_users_username_trgm_gist',
+        'username',
+        postgresql_using='gist',
+        postgresql_ops={'username': 'gist_trgm_ops'},
+    ),
+)
+
+user_tombstones = Table(
+    'user_tombstones',
+    metadata,
+    Column('user_id', UUID(as_uuid=True), primary_key=True),
+    Column('deleted_at', DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index('ix_user_tombstones_deleted_at_user_id', 'deleted_at', 'user_id'),
 )
 
 user_auth_state = Table(
@@ -91,14 +114,45 @@ outbox_events = Table(
     Column('id', UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
     Column('event_type', String, nullable=False),
     Column('routing_key', String, nullable=False),
-    Column('payload', Text, nullable=False),
+    Column('payload', LargeBinary, nullable=False),
     Column('created_at', DateTime(timezone=True), server_default=func.now()),
     Column('published_at', DateTime(timezone=True), nullable=True),
     Column('attempts', Integer, nullable=False, server_default='0'),
     Column('error_message', Text, nullable=True),
-    Index('ix_outbox_events_published_at', 'published_at'),
+    Column('next_attempt_at', DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column('ordering_key', String, nullable=True),
     Index('ix_outbox_events_created_at', 'created_at'),
 )
+Index(
+    'ix_outbox_events_pending_next_attempt_at',
+    outbox_events.c.next_attempt_at,
+    postgresql_where=outbox_events.c.published_at.is_(None),
+)
+Index(
+    'ix_outbox_events_pending_created_at',
+    outbox_events.c.created_at,
+    postgresql_where=outbox_events.c.published_at.is_(None),
+)
+Index(
+    'ix_outbox_events_pending_ordering_key_created_at',
+    outbox_events.c.ordering_key,
+    outbox_events.c.created_at,
+    postgresql_where=outbox_events.c.published_at.is_(None),
+)
+
+outbox_dead_letters = Table(
+    'outbox_dead_letters',
+    metadata,
+    Column('id', UUID(as_uuid=True), primary_key=True),
+    Column('event_type', String, nullable=False),
+    Column('routing_key', String, nullable=False),
+    Column('payload', LargeBinary, nullable=False),
+    Column('created_at', DateTime(timezone=True), nullable=True),
+    Column('attempts', Integer, nullable=False),
+    Column('error_message', Text, nullable=True),
+    Column('dead_lettered_at', DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index('ix_outbox_dead_letters_dead_lettered_at', 'dead_lettered_at'),
+)
 
 
 def start_mappers():
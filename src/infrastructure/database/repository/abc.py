@@ -1,9 +1,14 @@
 import abc
 import datetime
 import uuid
+from collections.abc import AsyncIterator, Sequence
 
 from src.domain.model import EmailVerificationToken, OutboxEvent, User, UserAuthState
 from src.schemas.internal.auth import RefreshToken
+from src.schemas.internal.outbox import OutboxBacklog
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_change import UserTombstone
+from src.schemas.internal.user_import import UserImportRecord, UserImportRowError
 
 
 class ABCUsersRepository(abc.ABC):
@@ -31,6 +36,40 @@ class ABCUsersRepository(abc.ABC):
     async def remove(self, user_id: uuid.UUID) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def import_many(self, records: Sequence[UserImportRecord]) -> list[UserImportRowError]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[User]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list_page(
+        self,
+        *,
+        limit: int,
+        before: tuple[datetime.datetime, uuid.UUID] | None = None,
+        is_verified: bool | None = None,
+        is_disabled: bool | None = None,
+        role: UserRole | None = None,
+    ) -> list[User]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list_changed(
+        self,
+        *,
+        limit: int,
+        until: datetime.datetime,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+    ) -> list[User | UserTombstone]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def search(self, query: str, limit: int) -> list[User]:
+        raise NotImplementedError
+
 
 class AbstractRefreshTokenRepository(abc.ABC):
     @abc.abstractmethod
@@ -87,9 +126,48 @@ class AbstractOutboxEventRepository(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def list_pending(self, limit: int) -> list[OutboxEvent]:
+    def pop_added(self) -> list[OutboxEvent]:
+        """Return and forget the events added for post-commit dispatch."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def claim_pending(
+        self,
+        limit: int,
+        now: datetime.datetime,
+        lease_until: datetime.datetime,
+    ) -> list[OutboxEvent]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_blocked(self, events: Sequence[OutboxEvent]) -> set[uuid.UUID]:
+        """Return the ids of ``events`` queued behind an unpublished event not among them."""
         raise NotImplementedError
 
     @abc.abstractmethod
     async def save(self, event: OutboxEvent) -> None:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    async def mark_published_many(self, ids: Sequence[uuid.UUID], now: datetime.datetime) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def mark_failed_many(self, events: Sequence[OutboxEvent]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def release_to_relay(self, events: Sequence[OutboxEvent], now: datetime.datetime) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def dead_letter_many(self, ids: Sequence[uuid.UUID], now: datetime.datetime) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def pending_stats(self, now: datetime.datetime) -> OutboxBacklog:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_published_before(self, cutoff: datetime.datetime, limit: int) -> int:
+        raise NotImplementedError
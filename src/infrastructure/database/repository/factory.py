@@ -1,4 +1,5 @@
 import abc
+import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -73,5 +74,8 @@ class ABCOutboxEventRepositoryFactory(abc.ABC):
 
 
 class SqlAlchemyOutboxEventRepositoryFactory(ABCOutboxEventRepositoryFactory):
+    def __init__(self, dispatch_grace: datetime.timedelta | None = None) -> None:
+        self.dispatch_grace = dispatch_grace
+
     def create(self, session: AsyncSession) -> AbstractOutboxEventRepository:
-        return SqlAlchemyOutboxEventRepository(session)
+        return SqlAlchemyOutboxEventRepository(session, dispatch_grace=self.dispatch_grace)
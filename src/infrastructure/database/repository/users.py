@@ -1,15 +1,39 @@
 import datetime
 import uuid
-
-from sqlalchemy import delete, insert, select, update
+from collections.abc import AsyncIterator, Sequence
+from typing import cast
+
+from sqlalchemy import (
+    UUID,
+    CursorResult,
+    Float,
+    all_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.model import EmailVerificationToken, OutboxEvent, User, UserAuthState
 from src.infrastructure.database.orm import (
     email_verification_tokens,
+    outbox_dead_letters,
     outbox_events,
     refresh_tokens,
     user_auth_state,
+    user_tombstones,
     users,
 )
 from src.infrastructure.database.repository.abc import (
@@ -20,6 +44,94 @@ from src.infrastructure.database.repository.abc import (
     AbstractUserAuthStateRepository,
 )
 from src.schemas.internal.auth import RefreshToken
+from src.schemas.internal.outbox import OutboxBacklog
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_change import UserTombstone, change_position
+from src.schemas.internal.user_import import (
+    UserImportErrorReason,
+    UserImportRecord,
+    UserImportRowError,
+)
+
+OUTBOX_EVENTS_CHANNEL = 'outbox_events'
+
+USERS_IMPORT_STAGE_TABLE = 'users_import_stage'
+USERS_IMPORT_STAGE_COLUMNS = (
+    'line_no',
+    'id',
+    'first_name',
+    'last_name',
+    'email',
+    'username',
+    'hashed_password',
+    'role',
+    'is_verified',
+    'is_disabled',
+    'created_at',
+)
+USER_AUTH_STATE_IMPORT_COLUMNS = ('user_id', 'failed_attempts', 'token_version', 'lock_count')
+
+_CREATE_USERS_IMPORT_STAGE = text(
+    f'CREATE TEMP TABLE {USERS_IMPORT_STAGE_TABLE} ('
+    'line_no integer NOT NULL, '
+    'id uuid NOT NULL, '
+    'first_name varchar NOT NULL, '
+    'last_name varchar NOT NULL, '
+    'email varchar NOT NULL, '
+    'username varchar NOT NULL, '
+    'hashed_password varchar NOT NULL, '
+    'role varchar NOT NULL, '
+    'is_verified boolean NOT NULL, '
+    'is_disabled boolean NOT NULL, '
+    'created_at timestamptz NOT NULL'
+    ') ON COMMIT DROP',
+)
+_SELECT_USERS_IMPORT_CONFLICTS = text(
+    f"""
+    WITH ranked AS (
+        SELECT
+            line_no,
+            row_number() OVER (PARTITION BY id ORDER BY line_no) AS id_rank,
+            row_number() OVER (PARTITION BY email ORDER BY line_no) AS email_rank,
+            row_number() OVER (PARTITION BY username ORDER BY line_no) AS username_rank
+        FROM {USERS_IMPORT_STAGE_TABLE}
+    )
+    SELECT line_no, 'id' AS field, 'duplicate_in_import' AS reason FROM ranked WHERE id_rank > 1
+    UNION ALL
+    SELECT line_no, 'email', 'duplicate_in_import' FROM ranked WHERE email_rank > 1
+    UNION ALL
+    SELECT line_no, 'username', 'duplicate_in_import' FROM ranked WHERE username_rank > 1
+    UNION ALL
+    SELECT s.line_no, 'id', 'already_exists'
+    FROM {USERS_IMPORT_STAGE_TABLE} s JOIN users u ON u.id = s.id
+    UNION ALL
+    SELECT s.line_no, 'email', 'already_exists'
+    FROM {USERS_IMPORT_STAGE_TABLE} s JOIN users u ON u.email = s.email
+    UNION ALL
+    SELECT s.line_no, 'username', 'already_exists'
+    FROM {USERS_IMPORT_STAGE_TABLE} s JOIN users u ON u.username = s.username
+    """,
+)
+_DELETE_USERS_IMPORT_LINES = text(
+    f'DELETE FROM {USERS_IMPORT_STAGE_TABLE} WHERE line_no = ANY(:line_nos)',
+)
+_INSERT_USERS_FROM_IMPORT_STAGE = text(
+    f"""
+    INSERT INTO users (
+        id, first_name, last_name, email, username, hashed_password,
+        role, is_verified, is_disabled, created_at, updated_at
+    )
+    SELECT
+        id, first_name, last_name, email, username, hashed_password,
+        role::userrole, is_verified, is_disabled, created_at, now()
+    FROM {USERS_IMPORT_STAGE_TABLE}
+    ORDER BY line_no
+    ON CONFLICT DO NOTHING
+    RETURNING id
+    """,
+)
+_DROP_USERS_IMPORT_STAGE = text(f'DROP TABLE {USERS_IMPORT_STAGE_TABLE}')
+_NOTIFY_OUTBOX_EVENTS = text(f"SELECT pg_notify('{OUTBOX_EVENTS_CHANNEL}', '')")
 
 
 class SQLAlchemyUsersRepository(ABCUsersRepository):
@@ -78,7 +190,193 @@ class SQLAlchemyUsersRepository(ABCUsersRepository):
         await self.session.execute(stmt)
 
     async def remove(self, user_id: uuid.UUID) -> None:
-        await self.session.execute(delete(users).where(users.c.id == user_id))
+        result = await self.session.execute(
+            delete(users).where(users.c.id == user_id).returning(users.c.id),
+        )
+        if result.scalar_one_or_none() is None:
+            return
+        stmt = pg_insert(user_tombstones).values(user_id=user_id, deleted_at=func.now())
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[user_tombstones.c.user_id],
+                set_={'deleted_at': stmt.excluded.deleted_at},
+            ),
+        )
+
+    async def import_many(self, records: Sequence[UserImportRecord]) -> list[UserImportRowError]:
+        """Load users and their auth state with COPY through a temporary staging table.
+
+        Rows that collide with existing users or with earlier rows of the same batch are
+        reported back instead of aborting the whole batch.
+        """
+        if not records:
+            return []
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None
+
+        await self.session.execute(_CREATE_USERS_IMPORT_STAGE)
+        await driver_connection.copy_records_to_table(
+            USERS_IMPORT_STAGE_TABLE,
+            records=[
+                (
+                    record.line_no,
+                    record.id,
+                    record.first_name,
+                    record.last_name,
+                    record.email,
+                    record.username,
+                    record.hashed_password,
+                    record.role.name,
+                    record.is_verified,
+                    record.is_disabled,
+                    record.created_at,
+                )
+                for record in records
+            ],
+            columns=USERS_IMPORT_STAGE_COLUMNS,
+        )
+
+        result = await self.session.execute(_SELECT_USERS_IMPORT_CONFLICTS)
+        errors = [
+            UserImportRowError(
+                line_no=row.line_no,
+                reason=UserImportErrorReason(row.reason),
+                field=row.field,
+            )
+            for row in result
+        ]
+        if errors:
+            await self.session.execute(
+                _DELETE_USERS_IMPORT_LINES,
+                {'line_nos': sorted({error.line_no for error in errors})},
+            )
+
+        result = await self.session.execute(_INSERT_USERS_FROM_IMPORT_STAGE)
+        inserted_ids = {row.id for row in result}
+        await self.session.execute(_DROP_USERS_IMPORT_STAGE)
+
+        if inserted_ids:
+            await driver_connection.copy_records_to_table(
+                'user_auth_state',
+                records=[(user_id, 0, 0, 0) for user_id in inserted_ids],
+                columns=USER_AUTH_STATE_IMPORT_COLUMNS,
+            )
+
+        rejected_lines = {error.line_no for error in errors}
+        errors.extend(
+            UserImportRowError(line_no=record.line_no, reason=UserImportErrorReason.CONFLICT)
+            for record in records
+            if record.id not in inserted_ids and record.line_no not in rejected_lines
+        )
+        return sorted(errors, key=lambda error: error.line_no)
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[User]:
+        """Iterate over all users through a server-side cursor, ``batch_size`` rows per fetch."""
+        result = await self.session.stream(
+            select(users).execution_options(yield_per=batch_size),
+        )
+        async for row in result:
+            yield self._row_to_user(row)
+
+    async def list_page(
+        self,
+        *,
+        limit: int,
+        before: tuple[datetime.datetime, uuid.UUID] | None = None,
+        is_verified: bool | None = None,
+        is_disabled: bool | None = None,
+        role: UserRole | None = None,
+    ) -> list[User]:
+        """Return newest-first users strictly older than the ``(created_at, id)`` keyset position."""
+        stmt = select(users)
+        if before is not None:
+            stmt = stmt.where(
+                tuple_(users.c.created_at, users.c.id)
+                < tuple_(*before, types=[users.c.created_at.type, users.c.id.type]),
+            )
+        if is_verified is not None:
+            stmt = stmt.where(users.c.is_verified == is_verified)
+        if is_disabled is not None:
+            stmt = stmt.where(users.c.is_disabled == is_disabled)
+        if role is not None:
+            stmt = stmt.where(users.c.role == role)
+
+        result = await self.session.execute(
+            stmt.order_by(users.c.created_at.desc(), users.c.id.desc()).limit(limit),
+        )
+        return [self._row_to_user(row) for row in result]
+
+    async def list_changed(
+        self,
+        *,
+        limit: int,
+        until: datetime.datetime,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+    ) -> list[User | UserTombstone]:
+        """Return users and deletions in ``(changed_at, id)`` order past ``after`` up to ``until``.
+
+        Live users and tombstones are read with one keyset range scan each and merged here.
+        """
+        changed = select(users).where(users.c.updated_at <= until)
+        deleted = select(user_tombstones).where(user_tombstones.c.deleted_at <= until)
+        if after is not None:
+            changed = changed.where(
+                tuple_(users.c.updated_at, users.c.id)
+                > tuple_(*after, types=[users.c.updated_at.type, users.c.id.type]),
+            )
+            deleted = deleted.where(
+                tuple_(user_tombstones.c.deleted_at, user_tombstones.c.user_id)
+                > tuple_(
+                    *after,
+                    types=[user_tombstones.c.deleted_at.type, user_tombstones.c.user_id.type],
+                ),
+            )
+
+        changed_rows = await self.session.execute(
+            changed.order_by(users.c.updated_at.asc(), users.c.id.asc()).limit(limit),
+        )
+        deleted_rows = await self.session.execute(
+            deleted.order_by(
+                user_tombstones.c.deleted_at.asc(),
+                user_tombstones.c.user_id.asc(),
+            ).limit(limit),
+        )
+        items: list[User | UserTombstone] = [self._row_to_user(row) for row in changed_rows]
+        items.extend(
+            UserTombstone(user_id=row.user_id, deleted_at=row.deleted_at) for row in deleted_rows
+        )
+        items.sort(key=change_position)
+        return items[:limit]
+
+    async def search(self, query: str, limit: int) -> list[User]:
+        """Substring search over email and username, nearest matches first.
+
+        Each column is filtered with ``ILIKE '%query%'`` and ordered by ``<->`` so the
+        GiST trigram indexes serve both and return the top ``limit`` rows directly;
+        the two lists are merged here. ``%`` is not used as the filter: it compares
+        whole strings, so a short prefix of a long email falls below the threshold.
+        """
+        pattern = f'%{_escape_like(query)}%'
+        branches = [
+            select(users, column.op('<->', return_type=Float)(query).label('distance'))
+            .where(column.ilike(pattern, escape='\\'))
+            .order_by(column.op('<->', return_type=Float)(query))
+            .limit(limit)
+            for column in (users.c.email, users.c.username)
+        ]
+        matches = union_all(*branches).subquery()
+        result = await self.session.execute(
+            select(matches).order_by(matches.c.distance, matches.c.id).limit(limit * 2),
+        )
+
+        found: dict[uuid.UUID, User] = {}
+        for row in result:
+            if row.id not in found:
+                found[row.id] = self._row_to_user(row)
+        return list(found.values())[:limit]
 
     def _row_to_user(self, row) -> User:
         record = row[0] if isinstance(row, tuple) else row
@@ -98,6 +396,10 @@ class SQLAlchemyUsersRepository(ABCUsersRepository):
         )
 
 
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
 class SqlAlchemyRefreshTokenRepository(AbstractRefreshTokenRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -251,10 +553,21 @@ class SqlAlchemyEmailVerificationTokenRepository(AbstractEmailVerificationTokenR
 
 
 class SqlAlchemyOutboxEventRepository(AbstractOutboxEventRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, dispatch_grace: datetime.timedelta | None = None):
+        """``dispatch_grace`` hands new events to the post-commit fast path.
+
+        The poller then leaves them alone for ``dispatch_grace`` and only picks
+        them up if the fast path did not publish them.
+        """
         self.session = session
+        self.dispatch_grace = dispatch_grace
+        self._added: list[OutboxEvent] = []
 
     async def add(self, event: OutboxEvent) -> None:
+        if event.next_attempt_at is None:
+            event.next_attempt_at = event.created_at
+            if self.dispatch_grace is not None:
+                event.next_attempt_at += self.dispatch_grace
         await self.session.execute(
             insert(outbox_events).values(
                 id=event.id,
@@ -265,17 +578,79 @@ class SqlAlchemyOutboxEventRepository(AbstractOutboxEventRepository):
                 published_at=event.published_at,
                 error_message=event.error_message,
                 attempts=event.attempts,
+                next_attempt_at=event.next_attempt_at,
+                ordering_key=event.ordering_key,
+            ),
+        )
+        if self.dispatch_grace is not None:
+            self._added.append(event)
+        else:
+            # Delivered by PostgreSQL only when the surrounding transaction commits.
+            await self.session.execute(_NOTIFY_OUTBOX_EVENTS)
+
+    def pop_added(self) -> list[OutboxEvent]:
+        added, self._added = self._added, []
+        return added
+
+    async def claim_pending(
+        self,
+        limit: int,
+        now: datetime.datetime,
+        lease_until: datetime.datetime,
+    ) -> list[OutboxEvent]:
+        """Claim up to ``limit`` events that are due at ``now`` until ``lease_until``.
+
+        Claimed rows get ``next_attempt_at = lease_until`` so other relays skip them
+        after this transaction commits, and the caller can publish without keeping
+        the transaction open. If the caller dies before acknowledging, the events
+        become due again once the lease expires. ``SKIP LOCKED`` keeps concurrent
+        claims from waiting on each other.
+
+        An event is only claimed together with every unpublished event ahead of it
+        under the same ``ordering_key``. Events behind one that is waiting for a
+        retry or leased to another relay are not even candidates, so they cannot
+        crowd due events out of the batch; events behind one this claim did not
+        get (over ``limit`` or locked by a concurrent claim) are left for later.
+        """
+        waiting = outbox_events.alias('waiting')
+        candidates = (
+            select(outbox_events.c.id, outbox_events.c.ordering_key, outbox_events.c.created_at)
+            .where(
+                outbox_events.c.published_at.is_(None),
+                outbox_events.c.next_attempt_at <= now,
+                ~exists().where(
+                    waiting.c.ordering_key == outbox_events.c.ordering_key,
+                    waiting.c.published_at.is_(None),
+                    waiting.c.next_attempt_at > now,
+                    tuple_(waiting.c.created_at, waiting.c.id)
+                    < tuple_(outbox_events.c.created_at, outbox_events.c.id),
+                ),
+            )
+            .order_by(outbox_events.c.next_attempt_at.asc(), outbox_events.c.created_at.asc())
+            .limit(limit)
+            .with_for_update(of=outbox_events, skip_locked=True)
+            .cte('candidates')
+        )
+        earlier = outbox_events.alias('earlier')
+        claimable = select(candidates.c.id).where(
+            ~exists().where(
+                earlier.c.ordering_key == candidates.c.ordering_key,
+                earlier.c.published_at.is_(None),
+                tuple_(earlier.c.created_at, earlier.c.id)
+                < tuple_(candidates.c.created_at, candidates.c.id),
+                earlier.c.id.not_in(select(candidates.c.id)),
             ),
         )
-
-    async def list_pending(self, limit: int) -> list[OutboxEvent]:
         result = await self.session.execute(
-            select(outbox_events)
-            .where(outbox_events.c.published_at.is_(None))
-            .order_by(outbox_events.c.created_at.asc())
-            .limit(limit),
+            update(outbox_events)
+            .where(outbox_events.c.id.in_(claimable))
+            .values(next_attempt_at=lease_until)
+            .returning(*outbox_events.c),
+        )
+        rows = sorted(
+            result.fetchall(),
+            key=lambda row: (row._mapping['created_at'], row._mapping['id']),
         )
-        rows = result.fetchall()
         return [
             OutboxEvent(
                 id=row._mapping['id'],
@@ -286,10 +661,32 @@ class SqlAlchemyOutboxEventRepository(AbstractOutboxEventRepository):
                 published_at=row._mapping['published_at'],
                 error_message=row._mapping['error_message'],
                 attempts=row._mapping['attempts'],
+                next_attempt_at=row._mapping['next_attempt_at'],
+                ordering_key=row._mapping['ordering_key'],
             )
             for row in rows
         ]
 
+    async def find_blocked(self, events: Sequence[OutboxEvent]) -> set[uuid.UUID]:
+        keyed = [event.id for event in events if event.ordering_key is not None]
+        if not keyed:
+            return set()
+        ids = _uuid_array(keyed)
+        earlier = outbox_events.alias('earlier')
+        result = await self.session.execute(
+            select(outbox_events.c.id).where(
+                outbox_events.c.id == any_(ids),
+                exists().where(
+                    earlier.c.ordering_key == outbox_events.c.ordering_key,
+                    earlier.c.published_at.is_(None),
+                    tuple_(earlier.c.created_at, earlier.c.id)
+                    < tuple_(outbox_events.c.created_at, outbox_events.c.id),
+                    earlier.c.id != all_(ids),
+                ),
+            ),
+        )
+        return set(result.scalars())
+
     async def save(self, event: OutboxEvent) -> None:
         await self.session.execute(
             update(outbox_events)
@@ -298,5 +695,128 @@ class SqlAlchemyOutboxEventRepository(AbstractOutboxEventRepository):
                 published_at=event.published_at,
                 error_message=event.error_message,
                 attempts=event.attempts,
+                next_attempt_at=event.next_attempt_at,
             ),
         )
+
+    async def mark_published_many(self, ids: Sequence[uuid.UUID], now: datetime.datetime) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            update(outbox_events)
+            .where(outbox_events.c.id == any_(_uuid_array(ids)))
+            .values(published_at=now, error_message=None),
+        )
+
+    async def mark_failed_many(self, events: Sequence[OutboxEvent]) -> None:
+        if not events:
+            return
+        await self.session.execute(
+            update(outbox_events)
+            .where(outbox_events.c.id == any_(_uuid_array([event.id for event in events])))
+            .values(
+                attempts=case(
+                    {event.id: event.attempts for event in events},
+                    value=outbox_events.c.id,
+                ),
+                error_message=case(
+                    {event.id: event.error_message for event in events},
+                    value=outbox_events.c.id,
+                ),
+                next_attempt_at=case(
+                    {event.id: event.next_attempt_at for event in events},
+                    value=outbox_events.c.id,
+                ),
+            ),
+        )
+
+    async def release_to_relay(self, events: Sequence[OutboxEvent], now: datetime.datetime) -> None:
+        """Make events the fast path gave up on due at ``now`` and wake the relays.
+
+        Only rows still holding the ``next_attempt_at`` they were added with are
+        touched, so events a relay has already claimed keep their lease.
+        """
+        if not events:
+            return
+        await self.session.execute(
+            update(outbox_events)
+            .where(
+                outbox_events.c.published_at.is_(None),
+                tuple_(outbox_events.c.id, outbox_events.c.next_attempt_at).in_(
+                    [(event.id, event.next_attempt_at) for event in events],
+                ),
+            )
+            .values(next_attempt_at=now),
+        )
+        await self.session.execute(_NOTIFY_OUTBOX_EVENTS)
+
+    async def dead_letter_many(self, ids: Sequence[uuid.UUID], now: datetime.datetime) -> None:
+        """Move events out of the outbox into ``outbox_dead_letters`` in one statement."""
+        if not ids:
+            return
+        columns = (
+            'id',
+            'event_type',
+            'routing_key',
+            'payload',
+            'created_at',
+            'attempts',
+            'error_message',
+        )
+        moved = (
+            delete(outbox_events)
+            .where(outbox_events.c.id == any_(_uuid_array(ids)))
+            .returning(*(outbox_events.c[name] for name in columns))
+            .cte('moved')
+        )
+        await self.session.execute(
+            insert(outbox_dead_letters).from_select(
+                [*columns, 'dead_lettered_at'],
+                select(
+                    *(moved.c[name] for name in columns),
+                    literal(now, outbox_dead_letters.c.dead_lettered_at.type),
+                ),
+            ),
+        )
+
+    async def pending_stats(self, now: datetime.datetime) -> OutboxBacklog:
+        is_due = outbox_events.c.next_attempt_at <= now
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.count().filter(~is_due),
+                func.min(outbox_events.c.next_attempt_at).filter(is_due),
+            ).where(outbox_events.c.published_at.is_(None)),
+        )
+        pending, deferred, oldest_due_at = result.one()
+        return OutboxBacklog(pending=pending, deferred=deferred, oldest_due_at=oldest_due_at)
+
+    async def delete_published_before(self, cutoff: datetime.datetime, limit: int) -> int:
+        """Delete up to ``limit`` events published before ``cutoff``; return the count.
+
+        ``published_at >= created_at``, so the ``created_at`` bound is implied by
+        the ``published_at`` one and lets the range scan use the ``created_at``
+        index instead of an index over every published row.
+        """
+        expired = (
+            select(outbox_events.c.id)
+            .where(
+                outbox_events.c.created_at < cutoff,
+                outbox_events.c.published_at < cutoff,
+            )
+            .order_by(outbox_events.c.created_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte('expired')
+        )
+        result = cast(
+            CursorResult,
+            await self.session.execute(
+                delete(outbox_events).where(outbox_events.c.id.in_(select(expired.c.id))),
+            ),
+        )
+        return result.rowcount
+
+
+def _uuid_array(ids: Sequence[uuid.UUID]):
+    return bindparam('ids', list(ids), type_=ARRAY(UUID(as_uuid=True)))
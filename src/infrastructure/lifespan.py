@@ -4,9 +4,24 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.application.dependencies import get_outbox_monitor, get_outbox_retention_service
+from src.application.outbox_monitor import OutboxMonitorWorker
+from src.application.outbox_retention import OutboxRetentionWorker
 from src.config.settings import get_settings
+from src.infrastructure.clients.subscriptions import (
+    close_subscriptions_client,
+    init_subscriptions_client,
+)
 from src.infrastructure.database.engine import get_engine
-from src.infrastructure.messaging.rabbit import RabbitOutboxRelaySupervisor
+from src.infrastructure.messaging.rabbit import (
+    RabbitOutboxRelaySupervisor,
+    RabbitSubscriptionEventsConsumer,
+    close_outbox_dispatcher,
+    create_outbox_relay_supervisor,
+    create_subscription_events_consumer,
+    init_outbox_dispatcher,
+)
+from src.infrastructure.redis_client import close_redis, init_redis
 
 logger = logging.getLogger(__name__)
 
@@ -15,17 +30,45 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
     relay_supervisor: RabbitOutboxRelaySupervisor | None = None
+    retention_worker: OutboxRetentionWorker | None = None
+    subscription_events_consumer: RabbitSubscriptionEventsConsumer | None = None
+    subscriptions_client = init_subscriptions_client()
+    if settings.FAILED_LOGINS_IN_REDIS:
+        init_redis()
 
-    if settings.RABBITMQ_URL:
-        relay_supervisor = RabbitOutboxRelaySupervisor(
-            url=settings.RABBITMQ_URL,
-            exchange_name=settings.RABBITMQ_EXCHANGE,
-        )
+    monitor_worker = OutboxMonitorWorker(
+        await get_outbox_monitor(),
+        interval_seconds=settings.OUTBOX_MONITOR_INTERVAL_SECONDS,
+    )
+    await monitor_worker.start()
+
+    if settings.RABBITMQ_URL and settings.OUTBOX_RELAY_IN_PROCESS:
+        relay_supervisor = create_outbox_relay_supervisor()
         await relay_supervisor.start()
+        retention_worker = OutboxRetentionWorker(
+            await get_outbox_retention_service(),
+            interval_seconds=settings.OUTBOX_RETENTION_INTERVAL_SECONDS,
+        )
+        await retention_worker.start()
+
+    if settings.RABBITMQ_URL and settings.OUTBOX_FAST_PATH_ENABLED:
+        await init_outbox_dispatcher().start()
+
+    if settings.RABBITMQ_URL and settings.SUBSCRIPTIONS_EVENTS_ENABLED and subscriptions_client:
+        subscription_events_consumer = create_subscription_events_consumer(subscriptions_client)
+        await subscription_events_consumer.start()
 
     try:
         yield
     finally:
+        await close_outbox_dispatcher()
+        await monitor_worker.stop()
+        if subscription_events_consumer is not None:
+            await subscription_events_consumer.stop()
+        await close_subscriptions_client()
+        await close_redis()
+        if retention_worker is not None:
+            await retention_worker.stop()
         if relay_supervisor is not None:
             await relay_supervisor.stop()
         engine = get_engine()
@@ -0,0 +1,45 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+OUTBOX_EVENTS_PUBLISHED = Counter(
+    'outbox_events_published_total',
+    'Outbox events confirmed by RabbitMQ.',
+)
+OUTBOX_PUBLISH_FAILURES = Counter(
+    'outbox_publish_failures_total',
+    'Outbox events whose publish failed, by exception type.',
+    labelnames=('error_type',),
+)
+OUTBOX_EVENTS_DEAD_LETTERED = Counter(
+    'outbox_events_dead_lettered_total',
+    'Outbox events moved to outbox_dead_letters after exhausting retries.',
+)
+OUTBOX_BATCH_SIZE = Histogram(
+    'outbox_relay_batch_size',
+    'Events claimed per relay batch.',
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+OUTBOX_PUBLISH_DURATION = Histogram(
+    'outbox_publish_batch_duration_seconds',
+    'Time from the first publish of a batch until the last broker confirm.',
+)
+OUTBOX_PENDING_EVENTS = Gauge(
+    'outbox_pending_events',
+    'Unpublished outbox events, as of the last backlog sample.',
+)
+OUTBOX_DEFERRED_EVENTS = Gauge(
+    'outbox_deferred_events',
+    'Unpublished outbox events in retry backoff or leased to a relay, as of the last sample.',
+)
+OUTBOX_OLDEST_DUE_AGE = Gauge(
+    'outbox_oldest_due_age_seconds',
+    'Time the longest-due outbox event has waited for a relay, as of the last backlog sample.',
+)
+OUTBOX_FAST_PATH_PUBLISHED = Counter(
+    'outbox_fast_path_published_total',
+    'Outbox events published right after commit, without the relay.',
+)
+OUTBOX_FAST_PATH_SKIPPED = Counter(
+    'outbox_fast_path_skipped_total',
+    'Outbox events left to the relay by the fast path, by reason.',
+    labelnames=('reason',),
+)
@@ -1,62 +1,216 @@
 import asyncio
+import functools
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from datetime import UTC, datetime
+import time
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 import aio_pika
+import orjson
 from aio_pika import DeliveryMode, Message, RobustChannel, RobustConnection
+from aio_pika.abc import AbstractExchange, AbstractIncomingMessage
+from pydantic import ValidationError
 
+from src.config.settings import get_settings
+from src.domain.model import OutboxEvent
+from src.infrastructure.clients.subscriptions import SubscriptionsClient
 from src.infrastructure.database.engine import get_session_factory
+from src.infrastructure.database.notifications import PostgresNotificationListener
 from src.infrastructure.database.repository.factory import SqlAlchemyOutboxEventRepositoryFactory
+from src.infrastructure.database.repository.users import OUTBOX_EVENTS_CHANNEL
+from src.infrastructure.messaging.outbox_metrics import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_EVENTS_DEAD_LETTERED,
+    OUTBOX_EVENTS_PUBLISHED,
+    OUTBOX_FAST_PATH_PUBLISHED,
+    OUTBOX_FAST_PATH_SKIPPED,
+    OUTBOX_PUBLISH_DURATION,
+    OUTBOX_PUBLISH_FAILURES,
+)
+from src.interfaces.api.schemas import UserSubscriptionSchema
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class RabbitMessage:
+    routing_key: str
+    payload: bytes
+    message_id: str
+
+
 class RabbitPublisher:
+    """Publish to a topic exchange over a channel with publisher confirms.
+
+    The exchange is declared once per channel and cached; ``publish_batch``
+    writes a whole batch before awaiting the broker confirms together.
+    """
+
     def __init__(self, connection: RobustConnection, exchange_name: str) -> None:
         self._connection = connection
         self._exchange_name = exchange_name
         self._channel: RobustChannel | None = None
+        self._exchange: AbstractExchange | None = None
+        self._setup_lock = asyncio.Lock()
 
     async def _channel_or_create(self) -> RobustChannel:
         if self._channel is None or self._channel.is_closed:
-            self._channel = await self._connection.channel()
+            self._channel = await self._connection.channel(publisher_confirms=True)
+            self._exchange = None
             await self._channel.set_qos(prefetch_count=10)
         return self._channel
 
-    async def publish(self, *, routing_key: str, payload: str, message_id: str) -> None:
-        channel = await self._channel_or_create()
-        exchange = await channel.declare_exchange(
-            self._exchange_name,
-            aio_pika.ExchangeType.TOPIC,
-            durable=True,
+    async def _exchange_or_declare(self) -> AbstractExchange:
+        if self._exchange is not None and self._channel is not None and not self._channel.is_closed:
+            return self._exchange
+        # Concurrent publishers must not each open a channel and declare the exchange.
+        async with self._setup_lock:
+            channel = await self._channel_or_create()
+            if self._exchange is None:
+                self._exchange = await channel.declare_exchange(
+                    self._exchange_name,
+                    aio_pika.ExchangeType.TOPIC,
+                    durable=True,
+                )
+            return self._exchange
+
+    @staticmethod
+    def _build_message(message: RabbitMessage) -> Message:
+        return Message(
+            body=message.payload,
+            content_type='application/json',
+            delivery_mode=DeliveryMode.PERSISTENT,
+            message_id=message.message_id,
+            timestamp=datetime.now(UTC),
         )
+
+    async def publish(self, *, routing_key: str, payload: bytes, message_id: str) -> None:
+        exchange = await self._exchange_or_declare()
         await exchange.publish(
-            Message(
-                body=payload.encode(),
-                content_type='application/json',
-                delivery_mode=DeliveryMode.PERSISTENT,
-                message_id=message_id,
-                timestamp=datetime.now(UTC),
+            self._build_message(
+                RabbitMessage(routing_key=routing_key, payload=payload, message_id=message_id),
             ),
             routing_key=routing_key,
         )
 
+    async def publish_batch(self, messages: Sequence[RabbitMessage]) -> list[BaseException | None]:
+        """Publish ``messages`` pipelined and return the confirm error of each one, if any."""
+        if not messages:
+            return []
+        exchange = await self._exchange_or_declare()
+        results = await asyncio.gather(
+            *(
+                exchange.publish(self._build_message(message), routing_key=message.routing_key)
+                for message in messages
+            ),
+            return_exceptions=True,
+        )
+        return [result if isinstance(result, BaseException) else None for result in results]
+
+
+class OutboxEventBlockedError(Exception):
+    def __init__(self, blocker_id: uuid.UUID) -> None:
+        super().__init__(f'Blocked by earlier event {blocker_id} with the same ordering key')
+        self.blocker_id = blocker_id
+
+
+def _outbox_message(event: OutboxEvent) -> RabbitMessage:
+    return RabbitMessage(
+        routing_key=event.routing_key,
+        payload=event.payload,
+        message_id=str(event.id),
+    )
+
+
+async def _publish_in_order(
+    publisher: RabbitPublisher,
+    events: Sequence[OutboxEvent],
+) -> list[BaseException | None]:
+    """Publish ``events`` and return the error of each one, if any.
+
+    Events sharing an ``ordering_key`` are sent one at a time, each only after the
+    previous one is confirmed. The first failure stops the key: the events behind
+    it get ``OutboxEventBlockedError`` and are not sent, so they are retried after
+    it, never before. Different keys are published concurrently and events without
+    a key are pipelined in one batch.
+    """
+    errors: list[BaseException | None] = [None] * len(events)
+    partitions: dict[str, list[int]] = {}
+    unordered: list[int] = []
+    for index, event in enumerate(events):
+        if event.ordering_key is None:
+            unordered.append(index)
+        else:
+            partitions.setdefault(event.ordering_key, []).append(index)
+
+    async def publish_partition(indexes: list[int]) -> None:
+        for position, index in enumerate(indexes):
+            event = events[index]
+            try:
+                await publisher.publish(
+                    routing_key=event.routing_key,
+                    payload=event.payload,
+                    message_id=str(event.id),
+                )
+            except Exception as exc:  # noqa: BLE001
+                errors[index] = exc
+                for blocked in indexes[position + 1 :]:
+                    errors[blocked] = OutboxEventBlockedError(event.id)
+                return
+
+    async def publish_unordered() -> None:
+        try:
+            results = await publisher.publish_batch(
+                [_outbox_message(events[index]) for index in unordered],
+            )
+        except Exception as exc:  # noqa: BLE001
+            results = [exc] * len(unordered)
+        for index, error in zip(unordered, results, strict=True):
+            errors[index] = error
+
+    await asyncio.gather(
+        publish_unordered(),
+        *(publish_partition(indexes) for indexes in partitions.values()),
+    )
+    return errors
+
 
 class RabbitOutboxRelay:
+    """Publish pending outbox events to RabbitMQ.
+
+    The relay sleeps until ``notify()`` is called (wired to PostgreSQL NOTIFY on
+    outbox inserts) and falls back to polling every ``poll_interval_seconds``.
+    Each batch is claimed, published and acknowledged in three steps; only the
+    claim and the acknowledgement touch the database, each in its own short
+    transaction.
+    """
+
     def __init__(
         self,
         *,
         publisher: RabbitPublisher,
-        poll_interval_seconds: float = 2.0,
+        poll_interval_seconds: float = 30.0,
         batch_size: int = 50,
+        error_retry_delay_seconds: float = 2.0,
+        max_attempts: int = 10,
+        retry_base_delay_seconds: float = 5.0,
+        retry_max_delay_seconds: float = 3600.0,
+        claim_lease_seconds: float = 60.0,
     ) -> None:
         self._publisher = publisher
         self._poll_interval_seconds = poll_interval_seconds
         self._batch_size = batch_size
+        self._error_retry_delay_seconds = error_retry_delay_seconds
+        self._max_attempts = max_attempts
+        self._retry_base_delay = timedelta(seconds=retry_base_delay_seconds)
+        self._retry_max_delay = timedelta(seconds=retry_max_delay_seconds)
+        self._claim_lease = timedelta(seconds=claim_lease_seconds)
         self._task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        self._wakeup = asyncio.Event()
 
     async def start(self) -> None:
         if self._task is not None:
@@ -68,44 +222,122 @@ class RabbitOutboxRelay:
         if self._task is None:
             return
         self._stop_event.set()
+        self._wakeup.set()
         await self._task
         self._task = None
 
-    async def _run(self) -> None:
-        session_factory = get_session_factory()
-        repo_factory = SqlAlchemyOutboxEventRepositoryFactory()
+    def notify(self) -> None:
+        self._wakeup.set()
 
+    async def _wait_for_wakeup(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+
+    async def _run(self) -> None:
         while not self._stop_event.is_set():
+            self._wakeup.clear()
             try:
-                async with session_factory() as session:
-                    repo = repo_factory.create(session)
-                    events = await repo.list_pending(limit=self._batch_size)
-                    if not events:
-                        await session.rollback()
-                        await asyncio.wait_for(
-                            self._stop_event.wait(),
-                            timeout=self._poll_interval_seconds,
-                        )
-                        continue
-
-                    for event in events:
-                        try:
-                            await self._publisher.publish(
-                                routing_key=event.routing_key,
-                                payload=event.payload,
-                                message_id=str(event.id),
-                            )
-                            event.mark_published(datetime.now(UTC))
-                        except Exception as exc:  # noqa: BLE001
-                            logger.exception('Failed to publish outbox event id=%s', event.id)
-                            event.mark_failed(str(exc))
-                        await repo.save(event)
-                    await session.commit()
-            except TimeoutError:
-                continue
+                processed = await self._process_batch()
             except Exception:  # noqa: BLE001
                 logger.exception('Outbox relay iteration failed')
-                await asyncio.sleep(self._poll_interval_seconds)
+                await self._wait_for_wakeup(self._error_retry_delay_seconds)
+                continue
+
+            if processed < self._batch_size:
+                await self._wait_for_wakeup(self._poll_interval_seconds)
+
+    async def _process_batch(self) -> int:
+        events = await self._claim_batch()
+        if not events:
+            return 0
+        OUTBOX_BATCH_SIZE.observe(len(events))
+
+        # Published with no database session held: broker latency must not pin a
+        # pooled connection. The claim lease keeps other relays off these events.
+        started = time.perf_counter()
+        errors = await _publish_in_order(self._publisher, events)
+        OUTBOX_PUBLISH_DURATION.observe(time.perf_counter() - started)
+        await self._acknowledge_batch(events, errors)
+        return len(events)
+
+    async def _claim_batch(self) -> list[OutboxEvent]:
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            repo = SqlAlchemyOutboxEventRepositoryFactory().create(session)
+            now = datetime.now(UTC)
+            events = await repo.claim_pending(
+                limit=self._batch_size,
+                now=now,
+                lease_until=now + self._claim_lease,
+            )
+            await session.commit()
+        return events
+
+    async def _acknowledge_batch(
+        self,
+        events: Sequence[OutboxEvent],
+        errors: Sequence[BaseException | None],
+    ) -> None:
+        now = datetime.now(UTC)
+        published: list[uuid.UUID] = []
+        failed: list[OutboxEvent] = []
+        dead_lettered: list[uuid.UUID] = []
+        by_id = {event.id: event for event in events}
+        for event, error in zip(events, errors, strict=True):
+            if error is None:
+                event.mark_published(now)
+                published.append(event.id)
+                continue
+
+            if isinstance(error, OutboxEventBlockedError):
+                blocker = by_id[error.blocker_id]
+                # The blocker comes first in the batch, so its retry is already scheduled.
+                assert blocker.next_attempt_at is not None
+                # A dead-lettered blocker no longer holds the key: retry right away.
+                retry_at = (
+                    now if blocker.is_exhausted(self._max_attempts) else blocker.next_attempt_at
+                )
+                event.defer(retry_at, str(error))
+                failed.append(event)
+                continue
+
+            event.mark_failed(
+                str(error),
+                now,
+                base_delay=self._retry_base_delay,
+                max_delay=self._retry_max_delay,
+            )
+            failed.append(event)
+            OUTBOX_PUBLISH_FAILURES.labels(error_type=type(error).__name__).inc()
+            if event.is_exhausted(self._max_attempts):
+                logger.error(
+                    'Outbox event id=%s exhausted %s attempts, moving to dead letters',
+                    event.id,
+                    event.attempts,
+                    exc_info=(type(error), error, error.__traceback__),
+                )
+                dead_lettered.append(event.id)
+            else:
+                assert event.next_attempt_at is not None
+                logger.error(
+                    'Failed to publish outbox event id=%s, retry at %s',
+                    event.id,
+                    event.next_attempt_at.isoformat(),
+                    exc_info=(type(error), error, error.__traceback__),
+                )
+
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            repo = SqlAlchemyOutboxEventRepositoryFactory().create(session)
+            await repo.mark_published_many(published, now)
+            await repo.mark_failed_many(failed)
+            await repo.dead_letter_many(dead_lettered, now)
+            await session.commit()
+
+        OUTBOX_EVENTS_PUBLISHED.inc(len(published))
+        OUTBOX_EVENTS_DEAD_LETTERED.inc(len(dead_lettered))
 
 
 class RabbitOutboxRelaySupervisor:
@@ -114,11 +346,27 @@ class RabbitOutboxRelaySupervisor:
         *,
         url: str,
         exchange_name: str,
+        postgres_dsn: str | None = None,
+        poll_interval_seconds: float = 30.0,
         retry_delay_seconds: float = 5.0,
+        max_attempts: int = 10,
+        retry_base_delay_seconds: float = 5.0,
+        retry_max_delay_seconds: float = 3600.0,
+        claim_lease_seconds: float = 60.0,
+        batch_size: int = 50,
+        concurrency: int = 1,
     ) -> None:
         self._url = url
         self._exchange_name = exchange_name
+        self._postgres_dsn = postgres_dsn
+        self._poll_interval_seconds = poll_interval_seconds
         self._retry_delay_seconds = retry_delay_seconds
+        self._max_attempts = max_attempts
+        self._retry_base_delay_seconds = retry_base_delay_seconds
+        self._retry_max_delay_seconds = retry_max_delay_seconds
+        self._claim_lease_seconds = claim_lease_seconds
+        self._batch_size = batch_size
+        self._concurrency = concurrency
         self._task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
 
@@ -140,14 +388,31 @@ class RabbitOutboxRelaySupervisor:
 
     async def _run(self) -> None:
         while not self._stop_event.is_set():
-            relay: RabbitOutboxRelay | None = None
+            relays: list[RabbitOutboxRelay] = []
+            listener: PostgresNotificationListener | None = None
             try:
-                logger.info('Starting RabbitMQ outbox relay')
+                logger.info('Starting RabbitMQ outbox relay concurrency=%s', self._concurrency)
                 async with rabbit_connection(self._url) as connection:
-                    relay = RabbitOutboxRelay(
-                        publisher=RabbitPublisher(connection, self._exchange_name),
-                    )
-                    await relay.start()
+                    publisher = RabbitPublisher(connection, self._exchange_name)
+                    for _ in range(self._concurrency):
+                        relay = RabbitOutboxRelay(
+                            publisher=publisher,
+                            poll_interval_seconds=self._poll_interval_seconds,
+                            batch_size=self._batch_size,
+                            max_attempts=self._max_attempts,
+                            retry_base_delay_seconds=self._retry_base_delay_seconds,
+                            retry_max_delay_seconds=self._retry_max_delay_seconds,
+                            claim_lease_seconds=self._claim_lease_seconds,
+                        )
+                        relays.append(relay)
+                        await relay.start()
+                    if self._postgres_dsn:
+                        listener = PostgresNotificationListener(
+                            dsn=self._postgres_dsn,
+                            channel=OUTBOX_EVENTS_CHANNEL,
+                            on_notification=functools.partial(_notify_all, relays),
+                        )
+                        await listener.start()
                     logger.info('RabbitMQ outbox relay started')
                     await self._stop_event.wait()
             except Exception:  # noqa: BLE001
@@ -162,10 +427,325 @@ class RabbitOutboxRelaySupervisor:
                 except TimeoutError:
                     continue
             finally:
-                if relay is not None:
+                if listener is not None:
+                    await listener.stop()
+                for relay in relays:
                     await relay.stop()
 
 
+class RabbitOutboxDispatcher:
+    """Publish outbox events right after their transaction commits.
+
+    This is a latency optimisation only: events are stored with
+    ``next_attempt_at = created_at + grace``. Events the dispatcher drops or
+    fails to publish are handed back to the relay right away (made due and
+    NOTIFYed); anything lost with the process is published once ``grace`` ends.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        exchange_name: str,
+        grace_seconds: float = 10.0,
+        queue_size: int = 1000,
+        batch_size: int = 50,
+        retry_delay_seconds: float = 5.0,
+    ) -> None:
+        self._url = url
+        self._exchange_name = exchange_name
+        self.grace = timedelta(seconds=grace_seconds)
+        self._batch_size = batch_size
+        self._retry_delay_seconds = retry_delay_seconds
+        self._queue: asyncio.Queue[OutboxEvent] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task | None = None
+        self._release_tasks: set[asyncio.Task] = set()
+
+    def dispatch(self, events: Sequence[OutboxEvent]) -> None:
+        dropped: list[OutboxEvent] = []
+        for event in events:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                dropped.append(event)
+        if dropped:
+            task = asyncio.create_task(self._release(dropped, reason='queue_full'))
+            self._release_tasks.add(task)
+            task.add_done_callback(self._release_tasks.discard)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name='users-rabbit-outbox-dispatcher')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Whatever is still queued or in flight is published by the relay.
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with rabbit_connection(self._url) as connection:
+                    publisher = RabbitPublisher(connection, self._exchange_name)
+                    logger.info('RabbitMQ outbox dispatcher started')
+                    while True:
+                        await self._dispatch_batch(publisher, await self._next_batch())
+            except Exception:  # noqa: BLE001
+                logger.exception('RabbitMQ outbox dispatcher crashed or failed to connect')
+                await asyncio.sleep(self._retry_delay_seconds)
+
+    async def _next_batch(self) -> list[OutboxEvent]:
+        batch = [await self._queue.get()]
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _dispatch_batch(self, publisher: RabbitPublisher, events: list[OutboxEvent]) -> None:
+        now = datetime.now(UTC)
+        # Past the grace period the relay may already have claimed the event.
+        fresh: list[OutboxEvent] = []
+        expired: list[OutboxEvent] = []
+        for event in events:
+            if event.next_attempt_at is not None and event.next_attempt_at > now:
+                fresh.append(event)
+            else:
+                expired.append(event)
+        await self._release(expired, reason='expired')
+        if not fresh:
+            return
+
+        # Events behind an unpublished predecessor with the same ordering key wait
+        # for it in the relay. If the check fails, the relay gets them after grace.
+        try:
+            async with get_session_factory()() as session:
+                repo = SqlAlchemyOutboxEventRepositoryFactory().create(session)
+                blocked_ids = await repo.find_blocked(fresh)
+        except Exception:  # noqa: BLE001
+            logger.exception('Failed to check ordering of %s fast-path outbox events', len(fresh))
+            return
+        await self._release(
+            [event for event in fresh if event.id in blocked_ids],
+            reason='blocked',
+        )
+        fresh = [event for event in fresh if event.id not in blocked_ids]
+        if not fresh:
+            return
+
+        try:
+            errors = await _publish_in_order(publisher, fresh)
+        except Exception:
+            await self._release(fresh, reason='publish_failed')
+            raise
+        failed = [event for event, error in zip(fresh, errors, strict=True) if error is not None]
+        published = [event.id for event, error in zip(fresh, errors, strict=True) if error is None]
+        await self._release(failed, reason='publish_failed')
+        if not published:
+            return
+
+        # A database error must not tear down the broker connection. Unmarked events
+        # are published again by the relay once their grace period ends.
+        try:
+            async with get_session_factory()() as session:
+                repo = SqlAlchemyOutboxEventRepositoryFactory().create(session)
+                await repo.mark_published_many(published, datetime.now(UTC))
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            logger.exception('Failed to mark %s fast-path outbox events published', len(published))
+            return
+        OUTBOX_FAST_PATH_PUBLISHED.inc(len(published))
+
+    async def _release(self, events: list[OutboxEvent], *, reason: str) -> None:
+        """Hand ``events`` back to the relay now instead of after the grace period."""
+        if not events:
+            return
+        OUTBOX_FAST_PATH_SKIPPED.labels(reason=reason).inc(len(events))
+        try:
+            async with get_session_factory()() as session:
+                repo = SqlAlchemyOutboxEventRepositoryFactory().create(session)
+                await repo.release_to_relay(events, datetime.now(UTC))
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            logger.exception('Failed to hand %s outbox events back to the relay', len(events))
+
+
+class RabbitSubscriptionEventsConsumer:
+    """Keep the local subscription cache in line with subscription-changed events.
+
+    Every process binds its own exclusive, auto-deleted queue to the topic
+    exchange, so each replica sees every event. Events carrying a
+    ``subscription`` snapshot (``null`` when the user has none) update the
+    cache; any other event for a user evicts the cached entry. The whole cache
+    is cleared after every (re)connect because events sent in between are lost.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        exchange_name: str,
+        binding_keys: Sequence[str],
+        subscriptions_client: SubscriptionsClient,
+        retry_delay_seconds: float = 5.0,
+        prefetch_count: int = 100,
+    ) -> None:
+        self._url = url
+        self._exchange_name = exchange_name
+        self._binding_keys = tuple(binding_keys)
+        self._subscriptions_client = subscriptions_client
+        self._retry_delay_seconds = retry_delay_seconds
+        self._prefetch_count = prefetch_count
+        self._task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(
+            self._run(),
+            name='users-rabbit-subscription-events-consumer',
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                async with rabbit_connection(self._url) as connection:
+                    channel = await connection.channel()
+                    await channel.set_qos(prefetch_count=self._prefetch_count)
+                    exchange = await channel.declare_exchange(
+                        self._exchange_name,
+                        aio_pika.ExchangeType.TOPIC,
+                        durable=True,
+                    )
+                    queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+                    for binding_key in self._binding_keys:
+                        await queue.bind(exchange, routing_key=binding_key)
+                    await queue.consume(self._on_message, no_ack=True)
+                    self._subscriptions_client.clear()
+                    # The robust connection restores the queue by itself; events sent
+                    # while it was down are lost all the same.
+                    connection.reconnect_callbacks.add(self._on_reconnect)
+                    logger.info(
+                        'Consuming subscription events binding_keys=%s',
+                        ','.join(self._binding_keys),
+                    )
+                    await self._stop_event.wait()
+            except Exception:  # noqa: BLE001
+                if self._stop_event.is_set():
+                    break
+                logger.exception(
+                    'RabbitMQ subscription events consumer crashed or failed to connect',
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(),
+                        timeout=self._retry_delay_seconds,
+                    )
+                except TimeoutError:
+                    continue
+
+    def _on_reconnect(self, *_: object) -> None:
+        self._subscriptions_client.clear()
+        logger.info('Reconnected to RabbitMQ, subscription cache cleared')
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        self.handle(message.body)
+
+    def handle(self, body: bytes) -> None:
+        try:
+            payload = orjson.loads(body)['payload']
+            user_id = uuid.UUID(str(payload['user_id']))
+            if 'subscription' not in payload:
+                self._subscriptions_client.invalidate(user_id)
+                return
+            snapshot = payload['subscription']
+            subscription = (
+                UserSubscriptionSchema.model_validate(snapshot) if snapshot is not None else None
+            )
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            if isinstance(exc, ValidationError):
+                # A snapshot we cannot read still tells us the cached entry is outdated.
+                self._subscriptions_client.invalidate(user_id)
+            logger.warning('Ignoring malformed subscription event', extra={'error': str(exc)})
+            return
+        self._subscriptions_client.update(user_id, subscription)
+
+
+_dispatcher: RabbitOutboxDispatcher | None = None
+
+
+def init_outbox_dispatcher() -> RabbitOutboxDispatcher:
+    global _dispatcher
+    if _dispatcher is not None:
+        raise RuntimeError('Outbox dispatcher already initialized')
+    settings = get_settings()
+    _dispatcher = RabbitOutboxDispatcher(
+        url=settings.RABBITMQ_URL,
+        exchange_name=settings.RABBITMQ_EXCHANGE,
+        grace_seconds=settings.OUTBOX_FAST_PATH_GRACE_SECONDS,
+        queue_size=settings.OUTBOX_FAST_PATH_QUEUE_SIZE,
+        batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+    )
+    return _dispatcher
+
+
+def get_outbox_dispatcher() -> RabbitOutboxDispatcher | None:
+    """Return the post-commit dispatcher, or ``None`` when the fast path is off."""
+    return _dispatcher
+
+
+async def close_outbox_dispatcher() -> None:
+    global _dispatcher
+    if _dispatcher is not None:
+        await _dispatcher.stop()
+        _dispatcher = None
+
+
+def _notify_all(relays: Sequence[RabbitOutboxRelay]) -> None:
+    for relay in relays:
+        relay.notify()
+
+
+def create_outbox_relay_supervisor() -> RabbitOutboxRelaySupervisor:
+    settings = get_settings()
+    return RabbitOutboxRelaySupervisor(
+        url=settings.RABBITMQ_URL,
+        exchange_name=settings.RABBITMQ_EXCHANGE,
+        postgres_dsn=settings.postgres_dsn,
+        poll_interval_seconds=settings.OUTBOX_RELAY_POLL_INTERVAL_SECONDS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        retry_base_delay_seconds=settings.OUTBOX_RETRY_BASE_DELAY_SECONDS,
+        retry_max_delay_seconds=settings.OUTBOX_RETRY_MAX_DELAY_SECONDS,
+        claim_lease_seconds=settings.OUTBOX_CLAIM_LEASE_SECONDS,
+        batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+        concurrency=settings.OUTBOX_RELAY_CONCURRENCY,
+    )
+
+
+def create_subscription_events_consumer(
+    subscriptions_client: SubscriptionsClient,
+) -> RabbitSubscriptionEventsConsumer:
+    settings = get_settings()
+    return RabbitSubscriptionEventsConsumer(
+        url=settings.RABBITMQ_URL,
+        exchange_name=settings.RABBITMQ_EXCHANGE,
+        binding_keys=settings.SUBSCRIPTIONS_EVENTS_BINDING_KEYS,
+        subscriptions_client=subscriptions_client,
+    )
+
+
 @asynccontextmanager
 async def rabbit_connection(url: str) -> AsyncIterator[RobustConnection]:
     connection = await aio_pika.connect_robust(url)
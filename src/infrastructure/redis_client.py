@@ -0,0 +1,37 @@
+import logging
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_redis: Redis | None = None
+
+
+def init_redis() -> Redis:
+    global _redis
+    if _redis is not None:
+        raise RuntimeError('Redis client already initialized')
+
+    settings = get_settings()
+    _redis = Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        health_check_interval=30,
+    )
+    logger.info('Redis client created')
+    return _redis
+
+
+def get_redis() -> Redis | None:
+    """Return the shared Redis client, or ``None`` when it was not initialized."""
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
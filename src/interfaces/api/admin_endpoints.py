@@ -0,0 +1,90 @@
+import logging
+import uuid
+
+from fastapi import APIRouter, Depends, Query, Request
+from starlette.responses import StreamingResponse
+
+from src.application.dependencies import (
+    get_user_admin_service,
+    get_user_export_service,
+    get_user_import_service,
+)
+from src.application.user_admin_service import UserAdminService
+from src.application.user_export import EXPORT_MEDIA_TYPES, UserExportService
+from src.application.user_import import UserImportService, iter_text_lines
+from src.interfaces.api.schemas import (
+    ApiError,
+    UserAdminResponseSchema,
+    UserImportReportSchema,
+    UserListSchema,
+)
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_import import UserDataFormat
+from src.utils.get_current_user import get_current_admin_id, get_current_staff_id
+
+router = APIRouter(prefix='/api/v1/users', tags=['users-admin'])
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    '',
+    response_model=UserListSchema,
+    responses={400: {'model': ApiError, 'description': 'Некорректный курсор'}},
+)
+async def list_users(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    is_verified: bool | None = Query(None),
+    is_disabled: bool | None = Query(None),
+    role: UserRole | None = Query(None),
+    staff_id: uuid.UUID = Depends(get_current_staff_id),
+    service: UserAdminService = Depends(get_user_admin_service),
+) -> UserListSchema:
+    page = await service.list_users(
+        limit=limit,
+        cursor=cursor,
+        is_verified=is_verified,
+        is_disabled=is_disabled,
+        role=role,
+    )
+    return UserListSchema(
+        items=[UserAdminResponseSchema.from_domain(user) for user in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get('/search', response_model=list[UserAdminResponseSchema])
+async def search_users(
+    q: str = Query(..., min_length=3, max_length=254),
+    limit: int = Query(20, ge=1, le=50),
+    staff_id: uuid.UUID = Depends(get_current_staff_id),
+    service: UserAdminService = Depends(get_user_admin_service),
+) -> list[UserAdminResponseSchema]:
+    found = await service.search_users(q, limit)
+    return [UserAdminResponseSchema.from_domain(user) for user in found]
+
+
+@router.post('/import', response_model=UserImportReportSchema)
+async def import_users(
+    request: Request,
+    import_format: UserDataFormat = Query(UserDataFormat.NDJSON, alias='format'),
+    admin_id: uuid.UUID = Depends(get_current_admin_id),
+    service: UserImportService = Depends(get_user_import_service),
+) -> UserImportReportSchema:
+    logger.info('User import started by admin_id=%s format=%s', admin_id, import_format.value)
+    report = await service.import_stream(iter_text_lines(request.stream()), import_format)
+    return UserImportReportSchema.from_report(report)
+
+
+@router.get('/export', response_class=StreamingResponse)
+async def export_users(
+    export_format: UserDataFormat = Query(UserDataFormat.NDJSON, alias='format'),
+    admin_id: uuid.UUID = Depends(get_current_admin_id),
+    service: UserExportService = Depends(get_user_export_service),
+) -> StreamingResponse:
+    logger.info('User export started by admin_id=%s format=%s', admin_id, export_format.value)
+    return StreamingResponse(
+        service.export(export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="users.{export_format.value}"'},
+    )
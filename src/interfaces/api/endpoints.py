@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import uuid
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from starlette.responses import JSONResponse, Response
@@ -7,10 +9,12 @@ from starlette.responses import JSONResponse, Response
 from src.application.auth_service import JWTAuthService
 from src.application.dependencies import (
     get_auth_service,
+    get_outbox_monitor,
     get_subscriptions_client,
     get_uow,
     get_user_service,
 )
+from src.application.outbox_monitor import OutboxMonitor
 from src.application.uow import AbstractUnitOfWork
 from src.application.utils import get_fingerprint
 from src.application.user_service import UserService
@@ -48,11 +52,26 @@ def _build_refresh_cookie_params(*, settings: Settings, auth_service: JWTAuthSer
 
 
 @router.get('/health')
-async def health(settings: Settings = settings_dependency) -> JSONResponse:
-    content = {
+async def health(
+    settings: Settings = settings_dependency,
+    outbox_monitor: OutboxMonitor = Depends(get_outbox_monitor),
+) -> JSONResponse:
+    content: dict[str, Any] = {
         'status': 'ok',
         'database': 'connected' if settings.POSTGRES_HOST else 'disconnected',
     }
+    outbox = outbox_monitor.latest()
+    if outbox is None:
+        content['outbox'] = {'status': 'unknown'}
+    else:
+        content['outbox'] = {
+            'status': 'lagging' if outbox.is_lagging else 'ok',
+            'pending': outbox.pending,
+            'deferred': outbox.deferred,
+            'lag_seconds': round(outbox.lag_seconds, 3),
+        }
+        if outbox.is_lagging:
+            content['status'] = 'degraded'
     return JSONResponse(content=content, status_code=status.HTTP_200_OK)
 
 
@@ -61,14 +80,38 @@ async def get_me(
     user_id: uuid.UUID = Depends(get_current_user_id),
     uow: AbstractUnitOfWork = Depends(get_uow),
     subscriptions_client: SubscriptionsClient = Depends(get_subscriptions_client),
+    settings: Settings = settings_dependency,
 ):
-    async with uow:
-        user_entity = await uow.users.get_by_id(user_id)
-    subscription = await subscriptions_client.get_by_user_id(user_id)
+    deadline = asyncio.get_running_loop().time() + settings.ME_REQUEST_TIMEOUT_SECONDS
+
+    async def load_user():
+        try:
+            async with asyncio.timeout_at(deadline), uow:
+                return await uow.users.get_by_id(user_id)
+        except TimeoutError as exc:
+            raise HTTPException(status.HTTP_504_GATEWAY_TIMEOUT, 'Profile lookup timed out') from exc
+
+    async def load_subscription():
+        # The subscription is optional: past the deadline the profile is served without it.
+        try:
+            async with asyncio.timeout_at(deadline):
+                return await subscriptions_client.get_by_user_id(user_id)
+        except TimeoutError:
+            logger.warning('Subscription lookup missed the /me deadline user_id=%s', user_id)
+            return None
+
+    # Both lookups share the deadline; if the user lookup fails the other one is cancelled.
+    try:
+        async with asyncio.TaskGroup() as group:
+            user_task = group.create_task(load_user())
+            subscription_task = group.create_task(load_subscription())
+    except ExceptionGroup as exc_group:
+        # Only the user lookup raises; hand its error to the exception handlers unwrapped.
+        raise exc_group.exceptions[0] from None
 
     return ProfileSchema(
-        user=UserResponseSchema.from_domain(user_entity),
-        user_subscription=subscription,
+        user=UserResponseSchema.from_domain(user_task.result()),
+        user_subscription=subscription_task.result(),
     )
 
 
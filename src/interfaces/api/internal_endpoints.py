@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.application.dependencies import get_user_admin_service
+from src.application.user_admin_service import UserAdminService
+from src.interfaces.api.schemas import (
+    ApiError,
+    UserChangeSchema,
+    UserChangesSchema,
+    UserDeletionSchema,
+)
+from src.schemas.internal.user_change import UserTombstone
+from src.utils.internal_auth import require_internal_token
+
+router = APIRouter(
+    prefix='/api/v1/users',
+    tags=['users-internal'],
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get(
+    '/changes',
+    response_model=UserChangesSchema,
+    responses={400: {'model': ApiError, 'description': 'Некорректный курсор'}},
+)
+async def list_user_changes(
+    cursor: str | None = Query(None),
+    limit: int = Query(500, ge=1, le=5000),
+    service: UserAdminService = Depends(get_user_admin_service),
+) -> UserChangesSchema:
+    page, has_more = await service.list_changes(limit=limit, cursor=cursor)
+    return UserChangesSchema(
+        items=[
+            UserChangeSchema.from_domain(change)
+            for change in page.items
+            if not isinstance(change, UserTombstone)
+        ],
+        deleted=[
+            UserDeletionSchema.from_tombstone(change)
+            for change in page.items
+            if isinstance(change, UserTombstone)
+        ],
+        next_cursor=page.next_cursor,
+        has_more=has_more,
+    )
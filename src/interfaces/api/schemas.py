@@ -3,6 +3,9 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, EmailStr
 
+from src.schemas.internal.user_change import UserTombstone
+from src.schemas.internal.user_import import UserImportReport
+
 
 class ApiError(BaseModel):
     code: str
@@ -34,6 +37,64 @@ class UserResponseSchema(BaseModel):
         )
 
 
+class UserAdminResponseSchema(UserResponseSchema):
+    is_disabled: bool
+    updated_at: datetime | None
+    last_login_at: datetime | None
+
+    @classmethod
+    def from_domain(cls, user) -> 'UserAdminResponseSchema':
+        return cls(
+            **UserResponseSchema.from_domain(user).model_dump(),
+            is_disabled=user.is_disabled,
+            updated_at=user.updated_at,
+            last_login_at=user.last_login_at,
+        )
+
+
+class UserListSchema(BaseModel):
+    items: list[UserAdminResponseSchema]
+    next_cursor: str | None = None
+
+
+class UserChangeSchema(BaseModel):
+    id: str
+    first_name: str
+    last_name: str
+    email: str
+    username: str
+    is_disabled: bool
+    updated_at: datetime
+
+    @classmethod
+    def from_domain(cls, user) -> 'UserChangeSchema':
+        return cls(
+            id=str(user.id),
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            username=user.username,
+            is_disabled=user.is_disabled,
+            updated_at=user.updated_at,
+        )
+
+
+class UserDeletionSchema(BaseModel):
+    id: str
+    deleted_at: datetime
+
+    @classmethod
+    def from_tombstone(cls, tombstone: UserTombstone) -> 'UserDeletionSchema':
+        return cls(id=str(tombstone.user_id), deleted_at=tombstone.deleted_at)
+
+
+class UserChangesSchema(BaseModel):
+    items: list[UserChangeSchema]
+    deleted: list[UserDeletionSchema] = []
+    next_cursor: str | None = None
+    has_more: bool = False
+
+
 class UserSubscriptionSchema(BaseModel):
     id: str
     user_id: str
@@ -92,3 +153,34 @@ class LoginSchema(BaseModel):
 class AccessTokenSchema(BaseModel):
     access_token: str
     access_expires_at: datetime
+
+
+class UserImportErrorSchema(BaseModel):
+    line: int
+    reason: str
+    field: str | None = None
+    message: str | None = None
+
+
+class UserImportReportSchema(BaseModel):
+    imported: int
+    rejected: int
+    errors: list[UserImportErrorSchema]
+    errors_truncated: bool = False
+
+    @classmethod
+    def from_report(cls, report: UserImportReport) -> 'UserImportReportSchema':
+        return cls(
+            imported=report.imported,
+            rejected=report.rejected,
+            errors=[
+                UserImportErrorSchema(
+                    line=error.line_no,
+                    reason=error.reason.value,
+                    field=error.field,
+                    message=error.message,
+                )
+                for error in report.errors
+            ],
+            errors_truncated=report.errors_truncated,
+        )
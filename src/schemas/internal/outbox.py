@@ -0,0 +1,18 @@
+import datetime
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxBacklog:
+    pending: int
+    deferred: int = 0
+    oldest_due_at: datetime.datetime | None = None
+
+    def lag(self, now: datetime.datetime) -> datetime.timedelta:
+        """How long the longest-due event has been waiting for a relay.
+
+        Events in retry backoff or leased to a relay are not due and do not count.
+        """
+        if self.oldest_due_at is None:
+            return datetime.timedelta(0)
+        return max(now - self.oldest_due_at, datetime.timedelta(0))
@@ -0,0 +1,20 @@
+import datetime
+import uuid
+from dataclasses import dataclass
+
+from src.domain.model import User
+
+
+@dataclass(frozen=True, slots=True)
+class UserTombstone:
+    """Marker left behind by a deleted user so the change feed can report the deletion."""
+
+    user_id: uuid.UUID
+    deleted_at: datetime.datetime
+
+
+def change_position(change: User | UserTombstone) -> tuple[datetime.datetime, uuid.UUID]:
+    """Return the ``(changed_at, id)`` keyset position of a change feed entry."""
+    if isinstance(change, UserTombstone):
+        return change.deleted_at, change.user_id
+    return change.updated_at, change.id
@@ -0,0 +1,49 @@
+import enum
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.schemas.internal.role import UserRole
+
+
+class UserDataFormat(str, enum.Enum):
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+
+
+class UserImportErrorReason(str, enum.Enum):
+    INVALID_ROW = 'invalid_row'
+    ALREADY_EXISTS = 'already_exists'
+    DUPLICATE_IN_IMPORT = 'duplicate_in_import'
+    CONFLICT = 'conflict'
+
+
+@dataclass(frozen=True, slots=True)
+class UserImportRecord:
+    line_no: int
+    id: uuid.UUID
+    first_name: str
+    last_name: str
+    email: str
+    username: str
+    hashed_password: str
+    role: UserRole
+    is_verified: bool
+    is_disabled: bool
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class UserImportRowError:
+    line_no: int
+    reason: UserImportErrorReason
+    field: str | None = None
+    message: str | None = None
+
+
+@dataclass
+class UserImportReport:
+    imported: int = 0
+    rejected: int = 0
+    errors: list[UserImportRowError] = field(default_factory=list)
+    errors_truncated: bool = False
@@ -8,6 +8,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from src.application.auth_service import JWTAuthService
 from src.application.dependencies import get_auth_service, get_uow
 from src.application.uow import AbstractUnitOfWork
+from src.schemas.internal.role import UserRole
 
 logger = logging.getLogger(__name__)
 access_security = HTTPBearer(auto_error=False)
@@ -29,3 +30,24 @@ async def get_current_user_id(
 
     request.state.user_id = str(payload.subject)
     return payload.subject
+
+
+def require_roles(*roles: UserRole):
+    """Build a dependency that admits only authenticated users with one of ``roles``."""
+    allowed_roles = frozenset(roles)
+
+    async def dependency(
+        user_id: UUID = Depends(get_current_user_id),
+        uow: AbstractUnitOfWork = Depends(get_uow),
+    ) -> UUID:
+        async with uow:
+            user = await uow.users.get_by_id(user_id)
+        if user is None or user.role not in allowed_roles:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Insufficient permissions')
+        return user_id
+
+    return dependency
+
+
+get_current_admin_id = require_roles(UserRole.ADMIN)
+get_current_staff_id = require_roles(UserRole.ADMIN, UserRole.MODERATOR)
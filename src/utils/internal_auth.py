@@ -0,0 +1,20 @@
+import secrets
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import APIKeyHeader
+
+from src.config.settings import Settings, get_settings
+
+internal_token_header = APIKeyHeader(name='X-Internal-Token', auto_error=False)
+
+
+async def require_internal_token(
+    token: str | None = Depends(internal_token_header),
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """Admit service-to-service calls that present the shared ``INTERNAL_API_TOKEN``."""
+    expected = settings.INTERNAL_API_TOKEN
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Internal API is disabled')
+    if not token or not secrets.compare_digest(token, expected):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid internal token')
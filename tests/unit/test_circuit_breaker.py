@@ -0,0 +1,72 @@
+from src.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _open_breaker(clock: _Clock) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=_Clock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_one_trial_per_timeout(self):
+        clock = _Clock()
+        breaker = _open_breaker(clock)
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        clock.now = 20
+        assert breaker.allow_request()
+
+    def test_successful_trial_closes(self):
+        clock = _Clock()
+        breaker = _open_breaker(clock)
+        clock.now = 10
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_trial_reopens(self):
+        clock = _Clock()
+        breaker = _open_breaker(clock)
+        clock.now = 10
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
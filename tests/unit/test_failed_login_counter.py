@@ -0,0 +1,135 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.abc_classes import ABCFailedLoginCounter
+from src.adapters.exceptions.login_counter_exceptions import FailedLoginCounterError
+from src.application.auth_service import JWTAuthService
+from src.domain.exceptions.exceptions import InvalidCredentialsError, MaxLoginAttemptsExceeded
+from src.domain.model import User, UserAuthState
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+class _InMemoryCounter(ABCFailedLoginCounter):
+    def __init__(self) -> None:
+        self.attempts: dict[uuid.UUID, int] = {}
+
+    async def increment(self, user_id, ttl):
+        self.attempts[user_id] = self.attempts.get(user_id, 0) + 1
+        return self.attempts[user_id]
+
+    async def reset(self, user_id):
+        self.attempts.pop(user_id, None)
+
+
+class _UnavailableCounter(ABCFailedLoginCounter):
+    async def increment(self, user_id, ttl):
+        raise FailedLoginCounterError('connection refused')
+
+    async def reset(self, user_id):
+        raise FailedLoginCounterError('connection refused')
+
+
+def _user() -> User:
+    return User(
+        user_id=uuid.uuid4(),
+        first_name='First',
+        last_name='Last',
+        email='user@example.com',
+        username='user',
+        hashed_password='hashed',
+        role=None,
+        created_at=NOW,
+        updated_at=NOW,
+        last_login_at=None,
+        is_verified=True,
+    )
+
+
+def _service(counter: ABCFailedLoginCounter | None, max_attempts: int = 3) -> JWTAuthService:
+    time_provider = MagicMock()
+    time_provider.now.return_value = NOW
+    hasher = MagicMock()
+    hasher.verify_password.side_effect = lambda password, hashed: password == 'correct'
+    return JWTAuthService(
+        jwt_backend=MagicMock(),
+        time_provider=time_provider,
+        hasher=hasher,
+        max_attempts=max_attempts,
+        lock_time=datetime.timedelta(minutes=15),
+        failed_login_counter=counter,
+    )
+
+
+@pytest.fixture
+def login_uow(fake_uow):
+    user = _user()
+    fake_uow.users.get_by_email.return_value = user
+    fake_uow.user_auth_state = AsyncMock()
+    fake_uow.user_auth_state.get_by_user_id.return_value = UserAuthState(
+        user_id=user.id,
+        failed_attempts=0,
+        lock_count=0,
+    )
+    return fake_uow
+
+
+async def _login(service: JWTAuthService, uow, password: str = 'wrong'):
+    return await service.login(
+        uow=uow,
+        email='user@example.com',
+        password=password,
+        fingerprint='fp',
+    )
+
+
+@pytest.mark.asyncio
+class TestFailedLoginCounter:
+    async def test_failed_attempts_are_counted_without_db_writes(self, login_uow):
+        service = _service(_InMemoryCounter())
+
+        for remaining in (2, 1):
+            with pytest.raises(InvalidCredentialsError) as exc_info:
+                await _login(service, login_uow)
+            assert exc_info.value.details['remaining_attempts'] == remaining
+
+        login_uow.user_auth_state.save.assert_not_awaited()
+
+    async def test_lock_is_persisted_and_counter_reset(self, login_uow):
+        counter = _InMemoryCounter()
+        service = _service(counter)
+
+        for _ in range(2):
+            with pytest.raises(InvalidCredentialsError):
+                await _login(service, login_uow)
+        with pytest.raises(MaxLoginAttemptsExceeded):
+            await _login(service, login_uow)
+
+        saved = login_uow.user_auth_state.save.await_args.args[0]
+        assert saved.lock_count == 1
+        assert saved.locked_until == NOW + datetime.timedelta(minutes=15)
+        assert counter.attempts == {}
+
+    async def test_unavailable_counter_falls_back_to_db(self, login_uow):
+        service = _service(_UnavailableCounter())
+
+        with pytest.raises(InvalidCredentialsError) as exc_info:
+            await _login(service, login_uow)
+
+        assert exc_info.value.details['remaining_attempts'] == 2
+        saved = login_uow.user_auth_state.save.await_args.args[0]
+        assert saved.failed_attempts == 1
+
+    async def test_successful_login_resets_counter(self, login_uow):
+        counter = _InMemoryCounter()
+        service = _service(counter)
+        service.create_token_pair = AsyncMock()
+        with pytest.raises(InvalidCredentialsError):
+            await _login(service, login_uow)
+
+        await _login(service, login_uow, password='correct')
+
+        assert counter.attempts == {}
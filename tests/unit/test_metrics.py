@@ -0,0 +1,80 @@
+import datetime
+from datetime import timedelta
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.application import outbox_monitor
+from src.application.outbox_monitor import OutboxMonitor
+from src.schemas.internal.outbox import OutboxBacklog
+
+NOW = datetime.datetime(2026, 1, 1, 12, 0, tzinfo=datetime.UTC)
+
+
+class FixedTimeProvider:
+    def __init__(self, now: datetime.datetime = NOW) -> None:
+        self._now = now
+
+    def now(self) -> datetime.datetime:
+        return self._now
+
+
+@pytest.fixture(autouse=True)
+def reset_latest_sample(monkeypatch):
+    monkeypatch.setattr(outbox_monitor, '_latest_health', None)
+
+
+@pytest.mark.asyncio
+class TestOutboxMonitor:
+    async def test_lag_over_threshold_is_flagged(self, fake_uow):
+        fake_uow.outbox_events.pending_stats.return_value = OutboxBacklog(
+            pending=42,
+            oldest_due_at=NOW - timedelta(minutes=10),
+        )
+        monitor = OutboxMonitor(fake_uow, FixedTimeProvider(), lag_threshold=timedelta(minutes=5))
+
+        health = await monitor.check()
+
+        assert health.pending == 42
+        assert health.lag_seconds == 600
+        assert health.is_lagging is True
+        assert REGISTRY.get_sample_value('outbox_pending_events') == 42
+
+    async def test_events_in_backoff_do_not_count_as_lag(self, fake_uow):
+        fake_uow.outbox_events.pending_stats.return_value = OutboxBacklog(pending=2, deferred=2)
+        monitor = OutboxMonitor(fake_uow, FixedTimeProvider(), lag_threshold=timedelta(minutes=5))
+
+        health = await monitor.check()
+
+        assert health.is_lagging is False
+        assert health.deferred == 2
+        assert REGISTRY.get_sample_value('outbox_deferred_events') == 2
+        fake_uow.outbox_events.pending_stats.assert_awaited_once_with(NOW)
+
+    async def test_empty_backlog_has_no_lag(self, fake_uow):
+        fake_uow.outbox_events.pending_stats.return_value = OutboxBacklog(pending=0)
+        monitor = OutboxMonitor(fake_uow, FixedTimeProvider())
+
+        health = await monitor.check()
+
+        assert health.lag_seconds == 0
+        assert health.is_lagging is False
+
+    async def test_latest_serves_the_cached_sample(self, fake_uow):
+        fake_uow.outbox_events.pending_stats.return_value = OutboxBacklog(pending=3)
+        monitor = OutboxMonitor(fake_uow, FixedTimeProvider())
+        assert monitor.latest() is None
+
+        sampled = await monitor.check()
+
+        assert monitor.latest() == sampled
+        fake_uow.outbox_events.pending_stats.assert_awaited_once()
+
+    async def test_stale_sample_is_not_reported(self, fake_uow):
+        fake_uow.outbox_events.pending_stats.return_value = OutboxBacklog(pending=3)
+        await OutboxMonitor(fake_uow, FixedTimeProvider()).check()
+
+        later = FixedTimeProvider(NOW + timedelta(minutes=2))
+        monitor = OutboxMonitor(fake_uow, later, max_sample_age=timedelta(minutes=1))
+
+        assert monitor.latest() is None
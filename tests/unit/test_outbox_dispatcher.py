@@ -0,0 +1,122 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.uow import SqlAlchemyUnitOfWork
+from src.domain.model import OutboxEvent
+from src.infrastructure.database.repository.factory import SqlAlchemyOutboxEventRepositoryFactory
+from src.infrastructure.messaging import rabbit
+from src.infrastructure.messaging.rabbit import RabbitOutboxDispatcher
+
+
+def _event(created_at: datetime.datetime | None = None) -> OutboxEvent:
+    return OutboxEvent(
+        id=uuid.uuid4(),
+        event_type='user.email_verification_requested',
+        routing_key='notifications.email.verification.requested',
+        payload=b'{}',
+        created_at=created_at or datetime.datetime.now(datetime.UTC),
+    )
+
+
+def _uow(dispatcher: RabbitOutboxDispatcher, grace: datetime.timedelta) -> SqlAlchemyUnitOfWork:
+    return SqlAlchemyUnitOfWork(
+        session_factory=MagicMock(return_value=AsyncMock()),
+        repo_factory=MagicMock(),
+        refresh_token_repo_factory=MagicMock(),
+        user_auth_state_repo_factory=MagicMock(),
+        email_verification_token_repo_factory=MagicMock(),
+        outbox_event_repo_factory=SqlAlchemyOutboxEventRepositoryFactory(dispatch_grace=grace),
+        outbox_dispatcher=dispatcher,
+    )
+
+
+@pytest.fixture
+def outbox_repo(monkeypatch):
+    repo = AsyncMock()
+    repo.find_blocked.return_value = set()
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = AsyncMock()
+    monkeypatch.setattr(rabbit, 'get_session_factory', lambda: session_factory)
+    monkeypatch.setattr(
+        rabbit,
+        'SqlAlchemyOutboxEventRepositoryFactory',
+        lambda: MagicMock(create=MagicMock(return_value=repo)),
+    )
+    return repo
+
+
+@pytest.mark.asyncio
+class TestOutboxFastPath:
+    async def test_committed_events_are_dispatched_with_grace(self):
+        dispatcher = MagicMock()
+        grace = datetime.timedelta(seconds=10)
+        event = _event()
+
+        async with _uow(dispatcher, grace) as uow:
+            await uow.outbox_events.add(event)
+            dispatcher.dispatch.assert_not_called()
+
+        dispatcher.dispatch.assert_called_once_with([event])
+        assert event.next_attempt_at == event.created_at + grace
+
+    async def test_rolled_back_events_are_not_dispatched(self):
+        dispatcher = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            async with _uow(dispatcher, datetime.timedelta(seconds=10)) as uow:
+                await uow.outbox_events.add(_event())
+                raise RuntimeError('boom')
+
+        dispatcher.dispatch.assert_not_called()
+
+    async def test_expired_and_failed_events_are_handed_back_to_the_relay(self, outbox_repo):
+        now = datetime.datetime.now(datetime.UTC)
+        fresh, failing, expired = _event(), _event(), _event()
+        fresh.next_attempt_at = failing.next_attempt_at = now + datetime.timedelta(seconds=10)
+        expired.next_attempt_at = now - datetime.timedelta(seconds=1)
+        publisher = AsyncMock()
+        publisher.publish_batch.return_value = [None, RuntimeError('nack')]
+        dispatcher = RabbitOutboxDispatcher(url='amqp://', exchange_name='events')
+
+        await dispatcher._dispatch_batch(publisher, [fresh, failing, expired])
+
+        assert len(publisher.publish_batch.await_args.args[0]) == 2
+        published_ids, _ = outbox_repo.mark_published_many.await_args.args
+        assert published_ids == [fresh.id]
+        released = [call.args[0] for call in outbox_repo.release_to_relay.await_args_list]
+        assert released == [[expired], [failing]]
+
+    async def test_database_error_does_not_break_the_broker_connection(self, outbox_repo):
+        event = _event()
+        event.next_attempt_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=10)
+        outbox_repo.mark_published_many.side_effect = ConnectionError('database is down')
+        publisher = AsyncMock()
+        publisher.publish_batch.return_value = [None]
+        dispatcher = RabbitOutboxDispatcher(url='amqp://', exchange_name='events')
+
+        await dispatcher._dispatch_batch(publisher, [event])
+
+        outbox_repo.release_to_relay.assert_not_awaited()
+
+    async def test_events_behind_an_unpublished_predecessor_are_left_to_the_relay(
+        self,
+        outbox_repo,
+    ):
+        blocked, free = _event(), _event()
+        blocked.next_attempt_at = free.next_attempt_at = (
+            datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=10)
+        )
+        outbox_repo.find_blocked.return_value = {blocked.id}
+        publisher = AsyncMock()
+        publisher.publish_batch.return_value = [None]
+        dispatcher = RabbitOutboxDispatcher(url='amqp://', exchange_name='events')
+
+        await dispatcher._dispatch_batch(publisher, [blocked, free])
+
+        [message] = publisher.publish_batch.await_args.args[0]
+        assert message.message_id == str(free.id)
+        outbox_repo.release_to_relay.assert_awaited_once()
+        assert outbox_repo.release_to_relay.await_args.args[0] == [blocked]
@@ -0,0 +1,231 @@
+import asyncio
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.model import OutboxEvent
+from src.infrastructure.messaging import rabbit
+from src.infrastructure.messaging.rabbit import RabbitOutboxRelay
+
+
+def _event(user_id: uuid.UUID | None = None) -> OutboxEvent:
+    return OutboxEvent(
+        id=uuid.uuid4(),
+        event_type='user.registered',
+        routing_key='users.user.registered',
+        payload=b'{}',
+        created_at=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+        ordering_key=f'user:{user_id}' if user_id else None,
+    )
+
+
+def _failing_publisher(*failing: OutboxEvent, log: list[str] | None = None) -> AsyncMock:
+    failing_ids = {str(event.id) for event in failing}
+
+    async def publish(*, routing_key, payload, message_id):
+        if log is not None:
+            log.append(message_id)
+        if message_id in failing_ids:
+            raise RuntimeError('nack')
+
+    async def publish_batch(messages):
+        if log is not None:
+            log.extend(message.message_id for message in messages)
+        return [
+            RuntimeError('nack') if message.message_id in failing_ids else None
+            for message in messages
+        ]
+
+    publisher = AsyncMock()
+    publisher.publish = publish
+    publisher.publish_batch = publish_batch
+    return publisher
+
+
+@pytest.fixture
+def outbox_db(monkeypatch):
+    """Patch the relay's session and repository factories, recording session scopes."""
+    repo = AsyncMock()
+    session = AsyncMock()
+    calls: list[str] = []
+
+    async def enter(*args):
+        calls.append('open')
+        return session
+
+    async def exit_(*args):
+        calls.append('close')
+        return False
+
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.side_effect = enter
+    session_factory.return_value.__aexit__.side_effect = exit_
+    monkeypatch.setattr(rabbit, 'get_session_factory', lambda: session_factory)
+    monkeypatch.setattr(
+        rabbit,
+        'SqlAlchemyOutboxEventRepositoryFactory',
+        lambda: MagicMock(create=MagicMock(return_value=repo)),
+    )
+    return repo, session, calls
+
+
+@pytest.mark.asyncio
+class TestRabbitOutboxRelay:
+    async def test_notify_wakes_idle_relay_before_poll_interval(self):
+        relay = RabbitOutboxRelay(publisher=AsyncMock(), poll_interval_seconds=60, batch_size=10)
+        relay._process_batch = AsyncMock(return_value=0)
+
+        await relay.start()
+        await asyncio.sleep(0.01)
+        assert relay._process_batch.await_count == 1
+
+        relay.notify()
+        await asyncio.sleep(0.01)
+        assert relay._process_batch.await_count == 2
+
+        await relay.stop()
+
+    async def test_full_batch_is_drained_without_waiting(self):
+        relay = RabbitOutboxRelay(publisher=AsyncMock(), poll_interval_seconds=60, batch_size=10)
+        relay._process_batch = AsyncMock(side_effect=[10, 10, 3, 0])
+
+        await relay.start()
+        await asyncio.sleep(0.01)
+        await relay.stop()
+
+        assert relay._process_batch.await_count == 3
+
+    async def test_batch_outcome_is_persisted_with_two_set_based_updates(self, outbox_db):
+        repo, session, _ = outbox_db
+        events = [_event(), _event(), _event()]
+        repo.claim_pending.return_value = events
+        relay = RabbitOutboxRelay(publisher=_failing_publisher(events[1]), batch_size=10)
+
+        assert await relay._process_batch() == 3
+
+        published_ids, _ = repo.mark_published_many.await_args.args
+        assert published_ids == [events[0].id, events[2].id]
+        repo.mark_failed_many.assert_awaited_once_with([events[1]])
+        assert events[1].attempts == 1
+        assert events[1].error_message == 'nack'
+        assert events[1].next_attempt_at is not None
+        repo.dead_letter_many.assert_awaited_once()
+        assert repo.dead_letter_many.await_args.args[0] == []
+        repo.save.assert_not_awaited()
+
+    async def test_publish_happens_outside_database_transactions(self, outbox_db):
+        repo, session, calls = outbox_db
+        repo.claim_pending.return_value = [_event()]
+        publisher = AsyncMock()
+
+        async def publish_batch(messages):
+            calls.append('publish')
+            return [None] * len(messages)
+
+        publisher.publish_batch = publish_batch
+        relay = RabbitOutboxRelay(publisher=publisher, claim_lease_seconds=30)
+
+        await relay._process_batch()
+
+        assert calls == ['open', 'close', 'publish', 'open', 'close']
+        assert session.commit.await_count == 2
+        claim_kwargs = repo.claim_pending.await_args.kwargs
+        assert (claim_kwargs['lease_until'] - claim_kwargs['now']).total_seconds() == 30
+
+    async def test_exhausted_event_is_dead_lettered(self, outbox_db):
+        repo, _, _ = outbox_db
+        event = _event()
+        event.attempts = 2
+        repo.claim_pending.return_value = [event]
+        relay = RabbitOutboxRelay(publisher=_failing_publisher(event), max_attempts=3)
+
+        await relay._process_batch()
+
+        repo.mark_failed_many.assert_awaited_once_with([event])
+        assert repo.dead_letter_many.await_args.args[0] == [event.id]
+
+    async def test_failure_blocks_later_events_of_the_same_user_only(self, outbox_db):
+        repo, _, _ = outbox_db
+        alice, bob = uuid.uuid4(), uuid.uuid4()
+        first, second, third = _event(alice), _event(alice), _event(alice)
+        other = _event(bob)
+        repo.claim_pending.return_value = [first, other, second, third]
+        attempted: list[str] = []
+        relay = RabbitOutboxRelay(publisher=_failing_publisher(second, log=attempted))
+
+        await relay._process_batch()
+
+        assert attempted.index(str(first.id)) < attempted.index(str(second.id))
+        published_ids, _ = repo.mark_published_many.await_args.args
+        assert set(published_ids) == {first.id, other.id}
+        assert repo.mark_failed_many.await_args.args[0] == [second, third]
+        assert second.attempts == 1
+        assert third.attempts == 0
+        assert third.next_attempt_at == second.next_attempt_at
+
+    async def test_events_behind_a_failed_first_event_are_never_published(self, outbox_db):
+        repo, _, _ = outbox_db
+        alice = uuid.uuid4()
+        first, later = _event(alice), _event(alice)
+        repo.claim_pending.return_value = [first, later]
+        attempted: list[str] = []
+        relay = RabbitOutboxRelay(publisher=_failing_publisher(first, log=attempted))
+
+        await relay._process_batch()
+
+        assert attempted == [str(first.id)]
+        published_ids, _ = repo.mark_published_many.await_args.args
+        assert published_ids == []
+        assert repo.mark_failed_many.await_args.args[0] == [first, later]
+
+    async def test_keys_are_published_concurrently_each_one_event_at_a_time(self, outbox_db):
+        repo, _, _ = outbox_db
+        users = [uuid.uuid4() for _ in range(5)]
+        repo.claim_pending.return_value = [_event(user_id) for user_id in users for _ in range(3)]
+        in_flight: dict[str, int] = {}
+        peak_per_key = 0
+        peak = 0
+
+        async def publish(*, routing_key, payload, message_id):
+            nonlocal peak_per_key, peak
+            key = next(
+                event.ordering_key
+                for event in repo.claim_pending.return_value
+                if str(event.id) == message_id
+            )
+            in_flight[key] = in_flight.get(key, 0) + 1
+            peak_per_key = max(peak_per_key, in_flight[key])
+            peak = max(peak, sum(in_flight.values()))
+            await asyncio.sleep(0.01)
+            in_flight[key] -= 1
+
+        publisher = AsyncMock()
+        publisher.publish = publish
+        publisher.publish_batch.return_value = []
+        relay = RabbitOutboxRelay(publisher=publisher, batch_size=15)
+
+        await relay._process_batch()
+
+        assert peak_per_key == 1
+        assert peak == 5
+
+
+class TestOutboxEventBackoff:
+    def test_retry_delay_doubles_up_to_max(self):
+        event = _event()
+        now = event.created_at
+        delays = []
+        for _ in range(5):
+            event.mark_failed(
+                'nack',
+                now,
+                base_delay=datetime.timedelta(seconds=5),
+                max_delay=datetime.timedelta(seconds=30),
+            )
+            delays.append((event.next_attempt_at - now).total_seconds())
+
+        assert delays == [5, 10, 20, 30, 30]
+        assert event.is_exhausted(5)
+        assert not event.is_exhausted(6)
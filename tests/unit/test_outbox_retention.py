@@ -0,0 +1,31 @@
+import datetime
+from datetime import timedelta
+
+import pytest
+
+from src.application.outbox_retention import OutboxRetentionService
+
+NOW = datetime.datetime(2026, 1, 8, tzinfo=datetime.UTC)
+
+
+class FixedTimeProvider:
+    def now(self) -> datetime.datetime:
+        return NOW
+
+
+@pytest.mark.asyncio
+class TestOutboxRetentionService:
+    async def test_purge_deletes_in_batches_until_short_batch(self, fake_uow):
+        fake_uow.outbox_events.delete_published_before.side_effect = [100, 100, 30]
+        service = OutboxRetentionService(
+            fake_uow,
+            FixedTimeProvider(),
+            retention=timedelta(days=7),
+            batch_size=100,
+        )
+
+        assert await service.purge() == 230
+
+        calls = fake_uow.outbox_events.delete_published_before.await_args_list
+        assert len(calls) == 3
+        assert {call.args for call in calls} == {(NOW - timedelta(days=7), 100)}
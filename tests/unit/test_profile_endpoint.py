@@ -0,0 +1,88 @@
+import asyncio
+import datetime
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.domain.exceptions.exceptions import DomainError
+from src.domain.model import User
+from src.interfaces.api.endpoints import get_me
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def _user() -> User:
+    return User(
+        user_id=uuid.uuid4(),
+        first_name='First',
+        last_name='Last',
+        email='user@example.com',
+        username='user',
+        hashed_password='hashed',
+        role=None,
+        created_at=NOW,
+        updated_at=NOW,
+        last_login_at=None,
+    )
+
+
+class _SubscriptionsClient:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.started = asyncio.Event()
+
+    async def get_by_user_id(self, user_id):
+        self.started.set()
+        await asyncio.sleep(self.delay)
+        return None
+
+
+def _settings(timeout: float = 1.0) -> SimpleNamespace:
+    return SimpleNamespace(ME_REQUEST_TIMEOUT_SECONDS=timeout)
+
+
+@pytest.mark.asyncio
+class TestGetMe:
+    async def test_user_and_subscription_are_loaded_concurrently(self, fake_uow):
+        user = _user()
+        subscriptions_client = _SubscriptionsClient(delay=0.05)
+
+        async def get_by_id(user_id):
+            # Only finishes once the subscription lookup is already running.
+            await asyncio.wait_for(subscriptions_client.started.wait(), timeout=1)
+            return user
+
+        fake_uow.users.get_by_id = get_by_id
+
+        profile = await get_me(user.id, fake_uow, subscriptions_client, _settings())
+
+        assert profile.user.email == user.email
+        assert profile.user_subscription is None
+
+    async def test_slow_subscription_lookup_is_dropped_at_deadline(self, fake_uow):
+        user = _user()
+        fake_uow.users.get_by_id.return_value = user
+
+        profile = await get_me(user.id, fake_uow, _SubscriptionsClient(delay=5), _settings(0.05))
+
+        assert profile.user.id == str(user.id)
+        assert profile.user_subscription is None
+
+    async def test_slow_user_lookup_times_out(self, fake_uow):
+        async def get_by_id(user_id):
+            await asyncio.sleep(5)
+
+        fake_uow.users.get_by_id = get_by_id
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_me(uuid.uuid4(), fake_uow, _SubscriptionsClient(), _settings(0.05))
+
+        assert exc_info.value.status_code == 504
+
+    async def test_user_lookup_error_is_not_wrapped(self, fake_uow):
+        fake_uow.users.get_by_id.side_effect = DomainError('boom')
+
+        with pytest.raises(DomainError):
+            await get_me(uuid.uuid4(), fake_uow, _SubscriptionsClient(), _settings())
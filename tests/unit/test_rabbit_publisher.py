@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.messaging.rabbit import RabbitMessage, RabbitPublisher
+
+CONFIRM_LATENCY_SECONDS = 0.005
+
+
+class FakeExchange:
+    """Broker stand-in: every publish is confirmed after a fixed round trip."""
+
+    def __init__(self, fail_routing_keys=()):
+        self.published = []
+        self.outstanding_confirms = 0
+        self.max_outstanding_confirms = 0
+        self._fail_routing_keys = set(fail_routing_keys)
+
+    async def publish(self, message, routing_key):
+        self.published.append((routing_key, message.message_id))
+        self.outstanding_confirms += 1
+        self.max_outstanding_confirms = max(
+            self.max_outstanding_confirms,
+            self.outstanding_confirms,
+        )
+        try:
+            await asyncio.sleep(CONFIRM_LATENCY_SECONDS)
+        finally:
+            self.outstanding_confirms -= 1
+        if routing_key in self._fail_routing_keys:
+            raise RuntimeError('nack')
+
+
+class FakeChannel:
+    def __init__(self, exchange):
+        self.is_closed = False
+        self.exchange = exchange
+        self.declare_calls = 0
+
+    async def set_qos(self, prefetch_count):
+        return None
+
+    async def declare_exchange(self, name, exchange_type, durable):
+        self.declare_calls += 1
+        return self.exchange
+
+
+class FakeConnection:
+    def __init__(self, channel):
+        self._channel = channel
+        self.channel_kwargs = None
+
+    async def channel(self, **kwargs):
+        self.channel_kwargs = kwargs
+        return self._channel
+
+
+def _messages(count, routing_key='users.test'):
+    return [
+        RabbitMessage(routing_key=routing_key, payload=b'{}', message_id=str(index))
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+class TestRabbitPublisher:
+    async def test_exchange_is_declared_once(self):
+        channel = FakeChannel(FakeExchange())
+        connection = FakeConnection(channel)
+        publisher = RabbitPublisher(connection, 'eebook.events')
+
+        for message in _messages(3):
+            await publisher.publish(
+                routing_key=message.routing_key,
+                payload=message.payload,
+                message_id=message.message_id,
+            )
+        await publisher.publish_batch(_messages(3))
+
+        assert channel.declare_calls == 1
+        assert connection.channel_kwargs == {'publisher_confirms': True}
+
+    async def test_concurrent_first_publishes_declare_once(self):
+        channel = FakeChannel(FakeExchange())
+        connection = FakeConnection(channel)
+        publisher = RabbitPublisher(connection, 'eebook.events')
+
+        await asyncio.gather(
+            *(
+                publisher.publish(
+                    routing_key=message.routing_key,
+                    payload=message.payload,
+                    message_id=message.message_id,
+                )
+                for message in _messages(5)
+            ),
+        )
+
+        assert channel.declare_calls == 1
+
+    async def test_publish_batch_reports_errors_per_message(self):
+        exchange = FakeExchange(fail_routing_keys={'bad'})
+        publisher = RabbitPublisher(FakeConnection(FakeChannel(exchange)), 'eebook.events')
+
+        errors = await publisher.publish_batch(_messages(2) + _messages(1, routing_key='bad'))
+
+        assert errors[:2] == [None, None]
+        assert isinstance(errors[2], RuntimeError)
+
+    async def test_publish_batch_pipelines_confirms(self):
+        exchange = FakeExchange()
+        publisher = RabbitPublisher(FakeConnection(FakeChannel(exchange)), 'eebook.events')
+
+        for message in _messages(3):
+            await publisher.publish(
+                routing_key=message.routing_key,
+                payload=message.payload,
+                message_id=message.message_id,
+            )
+        assert exchange.max_outstanding_confirms == 1
+
+        await publisher.publish_batch(_messages(20))
+        assert exchange.max_outstanding_confirms == 20
@@ -83,3 +83,12 @@ class TestSQLAlchemyUsersRepository:
 
         # проверка неправильного пароля
         assert not await repo.verify_password(sample_user.id, 'wrong_pass')
+
+    async def test_search_finds_short_prefix_of_long_email(self, repo, async_session, sample_user):
+        sample_user.email = 'john.smith.long.address@example.com'
+        sample_user.username = 'jsmith_from_the_sales_department'
+        await repo.add(sample_user)
+        await async_session.commit()
+
+        found = await repo.search('john', limit=10)
+        assert [user.id for user in found] == [sample_user.id]
@@ -0,0 +1,121 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from src.infrastructure.clients.subscriptions import SubscriptionsClient
+from src.infrastructure.messaging import rabbit
+from src.infrastructure.messaging.rabbit import RabbitSubscriptionEventsConsumer
+from src.interfaces.api.schemas import UserSubscriptionSchema
+
+
+@pytest.fixture
+def subscriptions_client():
+    return SubscriptionsClient(http_client=None)
+
+
+@pytest.fixture
+def consumer(subscriptions_client):
+    return RabbitSubscriptionEventsConsumer(
+        url='amqp://unused',
+        exchange_name='eebook.events',
+        binding_keys=['subscription.#'],
+        subscriptions_client=subscriptions_client,
+    )
+
+
+def _subscription(user_id: uuid.UUID, plan: str) -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'user_id': str(user_id),
+        'plan': plan,
+        'started_at': '2026-01-01T00:00:00Z',
+        'expires_at': None,
+        'is_active': True,
+    }
+
+
+def _event(payload: dict) -> bytes:
+    return orjson.dumps({'event_type': 'subscription.updated', 'payload': payload})
+
+
+def _cached(client: SubscriptionsClient, user_id: uuid.UUID):
+    return client._cache[user_id].subscription
+
+
+class TestRabbitSubscriptionEventsConsumer:
+    def test_snapshot_replaces_cached_entry(self, consumer, subscriptions_client):
+        user_id = uuid.uuid4()
+        subscriptions_client.update(
+            user_id,
+            UserSubscriptionSchema.model_validate(_subscription(user_id, 'pro')),
+        )
+
+        consumer.handle(
+            _event({'user_id': str(user_id), 'subscription': _subscription(user_id, 'team')}),
+        )
+
+        assert _cached(subscriptions_client, user_id).plan == 'team'
+
+    def test_null_snapshot_caches_missing_subscription(self, consumer, subscriptions_client):
+        user_id = uuid.uuid4()
+
+        consumer.handle(_event({'user_id': str(user_id), 'subscription': None}))
+
+        assert _cached(subscriptions_client, user_id) is None
+
+    def test_event_without_snapshot_evicts(self, consumer, subscriptions_client):
+        user_id = uuid.uuid4()
+        subscriptions_client.update(
+            user_id,
+            UserSubscriptionSchema.model_validate(_subscription(user_id, 'pro')),
+        )
+
+        consumer.handle(_event({'user_id': str(user_id), 'plan': 'team'}))
+
+        assert subscriptions_client.cache_size == 0
+
+    def test_invalid_snapshot_evicts(self, consumer, subscriptions_client):
+        user_id = uuid.uuid4()
+        subscriptions_client.update(
+            user_id,
+            UserSubscriptionSchema.model_validate(_subscription(user_id, 'pro')),
+        )
+
+        consumer.handle(_event({'user_id': str(user_id), 'subscription': {'plan': 'team'}}))
+
+        assert subscriptions_client.cache_size == 0
+
+    def test_malformed_event_is_ignored(self, consumer, subscriptions_client):
+        consumer.handle(b'not json')
+        consumer.handle(_event({'plan': 'team'}))
+
+        assert subscriptions_client.cache_size == 0
+
+
+@pytest.mark.asyncio
+async def test_reconnect_clears_the_cache(consumer, subscriptions_client, monkeypatch):
+    connection = MagicMock()
+    connection.channel = AsyncMock()
+
+    @asynccontextmanager
+    async def fake_connection(url):
+        yield connection
+
+    monkeypatch.setattr(rabbit, 'rabbit_connection', fake_connection)
+    await consumer.start()
+    await asyncio.sleep(0.01)
+    user_id = uuid.uuid4()
+    subscriptions_client.update(
+        user_id,
+        UserSubscriptionSchema.model_validate(_subscription(user_id, 'pro')),
+    )
+
+    [callback] = [call.args[0] for call in connection.reconnect_callbacks.add.call_args_list]
+    callback(connection)
+    await consumer.stop()
+
+    assert subscriptions_client.cache_size == 0
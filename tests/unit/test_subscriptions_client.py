@@ -0,0 +1,355 @@
+import asyncio
+import uuid
+
+import httpx
+import orjson
+import pytest
+from prometheus_client import REGISTRY
+
+from src.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitState
+from src.infrastructure.clients.subscriptions import SubscriptionsClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _lookups(outcome: str) -> float:
+    sample = REGISTRY.get_sample_value(
+        'subscriptions_request_duration_seconds_count',
+        {'outcome': outcome},
+    )
+    return sample or 0.0
+
+
+def _client(handler, **kwargs) -> SubscriptionsClient:
+    http_client = httpx.AsyncClient(
+        base_url='http://subscriptions',
+        transport=httpx.MockTransport(handler),
+    )
+    return SubscriptionsClient(http_client=http_client, **kwargs)
+
+
+def _subscription(user_id: uuid.UUID, plan: str = 'pro') -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'user_id': str(user_id),
+        'plan': plan,
+        'started_at': '2026-01-01T00:00:00Z',
+        'expires_at': None,
+        'is_active': True,
+    }
+
+
+class _FakeSubscriptionsService:
+    """In-memory stand-in for the subscriptions service single and bulk endpoints."""
+
+    def __init__(self, plans: dict[uuid.UUID, str]) -> None:
+        self.plans = plans
+        self.requests: list[httpx.Request] = []
+
+    def client(self, **kwargs) -> SubscriptionsClient:
+        return _client(self, **kwargs)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == 'POST' and request.url.path.endswith('/users/batch'):
+            user_ids = [uuid.UUID(item) for item in orjson.loads(request.content)['user_ids']]
+            return httpx.Response(
+                200,
+                json=[
+                    _subscription(user_id, self.plans[user_id])
+                    for user_id in user_ids
+                    if user_id in self.plans
+                ],
+            )
+        user_id = uuid.UUID(request.url.path.rsplit('/', 1)[-1])
+        if user_id not in self.plans:
+            return httpx.Response(404)
+        return httpx.Response(200, json=_subscription(user_id, self.plans[user_id]))
+
+
+@pytest.mark.asyncio
+class TestSubscriptionsClient:
+    async def test_not_found_returns_none_and_is_measured(self):
+        before = _lookups('not_found')
+        client = _client(lambda request: httpx.Response(404))
+
+        assert await client.get_by_user_id(uuid.uuid4()) is None
+        assert _lookups('not_found') == before + 1
+
+    async def test_transport_error_returns_none(self):
+        def handler(request):
+            raise httpx.ConnectError('refused', request=request)
+
+        before = _lookups('unavailable')
+        client = _client(handler)
+
+        assert await client.get_by_user_id(uuid.uuid4()) is None
+        assert _lookups('unavailable') == before + 1
+
+    async def test_pool_timeout_is_measured_separately(self):
+        def handler(request):
+            raise httpx.PoolTimeout('no connection available', request=request)
+
+        before = _lookups('pool_timeout')
+        client = _client(handler, circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+        assert await client.get_by_user_id(uuid.uuid4()) is None
+        assert _lookups('pool_timeout') == before + 1
+        assert client.circuit_state is CircuitState.CLOSED
+
+    async def test_in_flight_requests_are_tracked(self):
+        user_id = uuid.uuid4()
+        during = []
+
+        def handler(request):
+            during.append(REGISTRY.get_sample_value('subscriptions_requests_in_flight'))
+            return httpx.Response(200, json=_subscription(user_id))
+
+        client = _client(handler)
+        before = REGISTRY.get_sample_value('subscriptions_requests_in_flight')
+
+        await client.get_by_user_id(user_id)
+
+        assert during == [before + 1]
+        assert REGISTRY.get_sample_value('subscriptions_requests_in_flight') == before
+
+    async def test_disabled_client_skips_the_request(self):
+        assert await SubscriptionsClient(http_client=None).get_by_user_id(uuid.uuid4()) is None
+
+    async def test_fresh_entries_are_served_from_cache(self):
+        user_id = uuid.uuid4()
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=_subscription(user_id))
+
+        client = _client(handler)
+
+        first = await client.get_by_user_id(user_id)
+        second = await client.get_by_user_id(user_id)
+
+        assert first == second
+        assert first.plan == 'pro'
+        assert len(calls) == 1
+
+    async def test_stale_entry_is_served_while_refreshing(self):
+        user_id = uuid.uuid4()
+        plans = iter(['pro', 'team'])
+        clock = _Clock()
+        client = _client(
+            lambda request: httpx.Response(200, json=_subscription(user_id, next(plans))),
+            ttl_seconds=10,
+            stale_seconds=60,
+            clock=clock,
+        )
+        await client.get_by_user_id(user_id)
+
+        clock.now = 30
+        stale = await client.get_by_user_id(user_id)
+        await asyncio.sleep(0.01)
+        refreshed = await client.get_by_user_id(user_id)
+
+        assert stale.plan == 'pro'
+        assert refreshed.plan == 'team'
+
+    async def test_failed_refresh_keeps_stale_entry(self):
+        user_id = uuid.uuid4()
+        responses = iter([httpx.Response(200, json=_subscription(user_id)), httpx.Response(503)])
+        clock = _Clock()
+        client = _client(lambda request: next(responses), ttl_seconds=10, clock=clock)
+        await client.get_by_user_id(user_id)
+
+        clock.now = 30
+        await client.get_by_user_id(user_id)
+        await asyncio.sleep(0.01)
+
+        assert (await client.get_by_user_id(user_id)).plan == 'pro'
+
+    async def test_not_found_is_cached_for_negative_ttl(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        clock = _Clock()
+        client = _client(handler, negative_ttl_seconds=5, stale_seconds=0, clock=clock)
+        user_id = uuid.uuid4()
+
+        await client.get_by_user_id(user_id)
+        await client.get_by_user_id(user_id)
+        clock.now = 6
+        await client.get_by_user_id(user_id)
+
+        assert len(calls) == 2
+
+    async def test_errors_are_not_cached(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        client = _client(handler)
+        user_id = uuid.uuid4()
+
+        await client.get_by_user_id(user_id)
+        await client.get_by_user_id(user_id)
+
+        assert len(calls) == 2
+
+    async def test_cache_is_bounded(self):
+        client = _client(
+            lambda request: httpx.Response(
+                200,
+                json=_subscription(uuid.UUID(request.url.path.rsplit('/', 1)[-1])),
+            ),
+            max_entries=2,
+        )
+
+        for _ in range(3):
+            await client.get_by_user_id(uuid.uuid4())
+
+        assert client.cache_size == 2
+
+    async def test_oversized_entries_are_not_cached(self):
+        user_id = uuid.uuid4()
+        client = _client(
+            lambda request: httpx.Response(200, json=_subscription(user_id, 'x' * 100)),
+            max_entry_bytes=64,
+        )
+
+        assert (await client.get_by_user_id(user_id)).plan == 'x' * 100
+        assert client.cache_size == 0
+
+    async def test_invalidation_during_lookup_is_not_overwritten(self):
+        user_id = uuid.uuid4()
+        client = None
+
+        def handler(request):
+            client.invalidate(user_id)
+            return httpx.Response(200, json=_subscription(user_id))
+
+        client = _client(handler)
+
+        assert (await client.get_by_user_id(user_id)).plan == 'pro'
+        assert client.cache_size == 0
+
+    async def test_concurrent_lookups_share_one_request(self):
+        user_id = uuid.uuid4()
+        calls = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            calls.append(request)
+            await release.wait()
+            return httpx.Response(200, json=_subscription(user_id))
+
+        client = _client(handler)
+        lookups = [asyncio.create_task(client.get_by_user_id(user_id)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        release.set()
+
+        results = await asyncio.gather(*lookups)
+
+        assert len(calls) == 1
+        assert {result.plan for result in results} == {'pro'}
+
+    async def test_cancelled_caller_does_not_cancel_shared_lookup(self):
+        user_id = uuid.uuid4()
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, json=_subscription(user_id))
+
+        client = _client(handler)
+        impatient = asyncio.create_task(client.get_by_user_id(user_id))
+        patient = asyncio.create_task(client.get_by_user_id(user_id))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        release.set()
+
+        assert (await patient).plan == 'pro'
+
+    async def test_open_circuit_fails_fast(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30, clock=clock)
+        client = _client(handler, circuit_breaker=breaker)
+
+        for _ in range(4):
+            assert await client.get_by_user_id(uuid.uuid4()) is None
+
+        assert len(calls) == 2
+        assert client.circuit_state is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+class TestSubscriptionsClientBatch:
+    async def test_misses_are_fetched_in_one_request(self):
+        with_plan, without_plan = uuid.uuid4(), uuid.uuid4()
+        service = _FakeSubscriptionsService({with_plan: 'pro'})
+        client = service.client()
+
+        result = await client.get_by_user_ids([with_plan, without_plan, with_plan])
+
+        assert list(result) == [with_plan, without_plan]
+        assert result[with_plan].plan == 'pro'
+        assert result[without_plan] is None
+        assert len(service.requests) == 1
+
+    async def test_batch_fills_the_cache(self):
+        with_plan, without_plan = uuid.uuid4(), uuid.uuid4()
+        service = _FakeSubscriptionsService({with_plan: 'pro'})
+        client = service.client()
+
+        await client.get_by_user_ids([with_plan, without_plan])
+        assert (await client.get_by_user_id(with_plan)).plan == 'pro'
+        assert await client.get_by_user_id(without_plan) is None
+
+        assert len(service.requests) == 1
+
+    async def test_cached_users_are_not_requested(self):
+        cached, uncached = uuid.uuid4(), uuid.uuid4()
+        service = _FakeSubscriptionsService({cached: 'pro', uncached: 'team'})
+        client = service.client()
+        await client.get_by_user_id(cached)
+
+        result = await client.get_by_user_ids([cached, uncached])
+
+        assert {user_id: item.plan for user_id, item in result.items()} == {
+            cached: 'pro',
+            uncached: 'team',
+        }
+        batch_request = service.requests[-1]
+        assert orjson.loads(batch_request.content)['user_ids'] == [str(uncached)]
+
+    async def test_large_lookups_are_split_into_batches(self):
+        user_ids = [uuid.uuid4() for _ in range(5)]
+        service = _FakeSubscriptionsService(dict.fromkeys(user_ids, 'pro'))
+        client = service.client(batch_size=2)
+
+        result = await client.get_by_user_ids(user_ids)
+
+        assert all(item.plan == 'pro' for item in result.values())
+        assert len(service.requests) == 3
+
+    async def test_failed_batch_returns_none_and_is_not_cached(self):
+        client = _client(lambda request: httpx.Response(503))
+        user_id = uuid.uuid4()
+
+        assert await client.get_by_user_ids([user_id]) == {user_id: None}
+        assert client.cache_size == 0
@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.uow import SqlAlchemyUnitOfWork
+
+
+def _uow(session: AsyncMock | None = None) -> SqlAlchemyUnitOfWork:
+    outbox_repo = MagicMock()
+    outbox_repo.pop_added.return_value = []
+    return SqlAlchemyUnitOfWork(
+        session_factory=MagicMock(return_value=session or AsyncMock()),
+        repo_factory=MagicMock(),
+        refresh_token_repo_factory=MagicMock(),
+        user_auth_state_repo_factory=MagicMock(),
+        email_verification_token_repo_factory=MagicMock(),
+        outbox_event_repo_factory=MagicMock(create=MagicMock(return_value=outbox_repo)),
+    )
+
+
+@pytest.mark.asyncio
+class TestUnitOfWorkCallbacks:
+    async def test_on_commit_runs_after_implicit_commit(self):
+        calls = []
+        finished = asyncio.Event()
+
+        async def invalidate_cache():
+            calls.append('async')
+            finished.set()
+
+        async with _uow() as uow:
+            uow.on_commit(lambda: calls.append('sync'))
+            uow.on_commit(invalidate_cache)
+            uow.on_rollback(lambda: calls.append('rollback'))
+            assert calls == []
+
+        await asyncio.wait_for(finished.wait(), timeout=1)
+        assert calls == ['sync', 'async']
+
+    async def test_callbacks_are_scoped_to_each_commit(self):
+        calls = []
+
+        async with _uow() as uow:
+            uow.on_commit(lambda: calls.append('first'))
+            await uow.commit()
+            uow.on_commit(lambda: calls.append('second'))
+
+        assert calls == ['first', 'second']
+
+    async def test_on_rollback_runs_when_the_block_fails(self):
+        calls = []
+
+        with pytest.raises(RuntimeError):
+            async with _uow() as uow:
+                uow.on_commit(lambda: calls.append('commit'))
+                uow.on_rollback(lambda: calls.append('rollback'))
+                raise RuntimeError('boom')
+
+        assert calls == ['rollback']
+
+    async def test_on_rollback_runs_when_commit_fails(self):
+        session = AsyncMock()
+        session.commit.side_effect = ConnectionError('lost')
+        calls = []
+
+        with pytest.raises(ConnectionError):
+            async with _uow(session) as uow:
+                uow.on_commit(lambda: calls.append('commit'))
+                uow.on_rollback(lambda: calls.append('rollback'))
+
+        assert calls == ['rollback']
+        session.close.assert_awaited_once()
+
+    async def test_failing_callback_does_not_break_the_caller(self):
+        calls = []
+
+        def broken():
+            raise ValueError('callback bug')
+
+        async with _uow() as uow:
+            uow.on_commit(broken)
+            uow.on_commit(lambda: calls.append('next'))
+
+        assert calls == ['next']
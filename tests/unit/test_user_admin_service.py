@@ -0,0 +1,127 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.cursors import decode_keyset_cursor, encode_keyset_cursor
+from src.application.exceptions import InvalidCursorError
+from src.application.user_admin_service import UserAdminService
+from src.domain.model import User
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_change import UserTombstone
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+class FixedTimeProvider:
+    def now(self) -> datetime.datetime:
+        return NOW
+
+
+def _user(index: int) -> User:
+    return User(
+        user_id=uuid.uuid4(),
+        first_name='First',
+        last_name='Last',
+        email=f'user{index}@example.com',
+        username=f'user{index}',
+        hashed_password='hashed',
+        role=None,
+        created_at=NOW - datetime.timedelta(minutes=index),
+        updated_at=NOW,
+        last_login_at=None,
+    )
+
+
+class TestKeysetCursor:
+    def test_roundtrip(self):
+        position = (NOW, uuid.uuid4())
+        assert decode_keyset_cursor(encode_keyset_cursor(position)) == position
+
+    @pytest.mark.parametrize('cursor', ['', 'not-base64!', encode_keyset_cursor((NOW.replace(tzinfo=None), uuid.uuid4()))])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_keyset_cursor(cursor)
+
+
+@pytest.mark.asyncio
+class TestUserAdminService:
+    async def test_list_users_returns_next_cursor_when_more_rows(self, fake_uow):
+        users = [_user(index) for index in range(3)]
+        fake_uow.users.list_page = AsyncMock(return_value=users)
+        service = UserAdminService(fake_uow, FixedTimeProvider())
+
+        page = await service.list_users(limit=2, role=UserRole.ADMIN)
+
+        assert page.items == users[:2]
+        assert decode_keyset_cursor(page.next_cursor) == (users[1].created_at, users[1].id)
+        fake_uow.users.list_page.assert_awaited_once_with(
+            limit=3,
+            before=None,
+            is_verified=None,
+            is_disabled=None,
+            role=UserRole.ADMIN,
+        )
+
+    async def test_list_users_last_page(self, fake_uow):
+        users = [_user(index) for index in range(2)]
+        fake_uow.users.list_page = AsyncMock(return_value=users)
+        service = UserAdminService(fake_uow, FixedTimeProvider())
+        cursor = encode_keyset_cursor((NOW, uuid.uuid4()))
+
+        page = await service.list_users(limit=2, cursor=cursor)
+
+        assert page.next_cursor is None
+        assert fake_uow.users.list_page.await_args.kwargs['before'] == decode_keyset_cursor(cursor)
+
+    async def test_search_users_strips_query(self, fake_uow):
+        found = [_user(1)]
+        fake_uow.users.search = AsyncMock(return_value=found)
+        service = UserAdminService(fake_uow, FixedTimeProvider())
+
+        assert await service.search_users('  user1 ', limit=10) == found
+        fake_uow.users.search.assert_awaited_once_with('user1', 10)
+
+    async def test_list_changes_holds_back_unsettled_rows(self, fake_uow):
+        changed = [_user(index) for index in range(3)]
+        fake_uow.users.list_changed = AsyncMock(return_value=changed)
+        service = UserAdminService(
+            fake_uow,
+            FixedTimeProvider(),
+            change_feed_settle_delay=datetime.timedelta(seconds=5),
+        )
+
+        page, has_more = await service.list_changes(limit=2)
+
+        assert has_more is True
+        assert page.items == changed[:2]
+        assert decode_keyset_cursor(page.next_cursor) == (changed[1].updated_at, changed[1].id)
+        fake_uow.users.list_changed.assert_awaited_once_with(
+            limit=3,
+            until=NOW - datetime.timedelta(seconds=5),
+            after=None,
+        )
+
+    async def test_list_changes_keeps_cursor_when_nothing_changed(self, fake_uow):
+        fake_uow.users.list_changed = AsyncMock(return_value=[])
+        service = UserAdminService(fake_uow, FixedTimeProvider())
+        cursor = encode_keyset_cursor((NOW, uuid.uuid4()))
+
+        page, has_more = await service.list_changes(limit=10, cursor=cursor)
+
+        assert page.items == []
+        assert page.next_cursor == cursor
+        assert has_more is False
+
+    async def test_list_changes_resumes_after_a_deletion(self, fake_uow):
+        tombstone = UserTombstone(user_id=uuid.uuid4(), deleted_at=NOW)
+        changed = [_user(0), tombstone]
+        fake_uow.users.list_changed = AsyncMock(return_value=changed)
+        service = UserAdminService(fake_uow, FixedTimeProvider())
+
+        page, has_more = await service.list_changes(limit=2)
+
+        assert has_more is False
+        assert page.items == changed
+        assert decode_keyset_cursor(page.next_cursor) == (NOW, tombstone.user_id)
@@ -0,0 +1,60 @@
+import datetime
+import json
+import uuid
+
+import pytest
+
+from src.application.user_export import UserExportService
+from src.domain.model import User
+from src.schemas.internal.user_import import UserDataFormat
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def _user(index: int) -> User:
+    return User(
+        user_id=uuid.uuid4(),
+        first_name=f'First{index}',
+        last_name=f'Last{index}',
+        email=f'user{index}@example.com',
+        username=f'user{index}',
+        hashed_password='hashed',
+        role=None,
+        created_at=NOW,
+        updated_at=NOW,
+        last_login_at=None,
+    )
+
+
+@pytest.mark.asyncio
+class TestUserExportService:
+    async def test_ndjson_export_is_chunked(self, fake_uow):
+        exported = [_user(index) for index in range(5)]
+
+        async def stream_all(batch_size):
+            for user in exported:
+                yield user
+
+        fake_uow.users.stream_all = stream_all
+        service = UserExportService(fake_uow, batch_size=2)
+
+        chunks = [chunk async for chunk in service.export(UserDataFormat.NDJSON)]
+
+        assert len(chunks) == 3
+        rows = [json.loads(line) for line in b''.join(chunks).decode().splitlines()]
+        assert [row['email'] for row in rows] == [user.email for user in exported]
+        assert rows[0]['role'] == 'user'
+        assert rows[0]['last_login_at'] is None
+
+    async def test_csv_export_has_header(self, fake_uow):
+        async def stream_all(batch_size):
+            yield _user(1)
+
+        fake_uow.users.stream_all = stream_all
+        service = UserExportService(fake_uow)
+
+        body = b''.join([chunk async for chunk in service.export(UserDataFormat.CSV)]).decode()
+
+        header, row = body.splitlines()
+        assert header.startswith('id,first_name,last_name,email')
+        assert 'user1@example.com' in row
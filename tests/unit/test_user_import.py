@@ -0,0 +1,148 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.user_import import UserImportService, iter_text_lines
+from src.schemas.internal.role import UserRole
+from src.schemas.internal.user_import import (
+    UserDataFormat,
+    UserImportErrorReason,
+    UserImportRowError,
+)
+
+
+class ImportHasher:
+    def is_valid_hash(self, hashed_password: str) -> bool:
+        return hashed_password.startswith('$argon2')
+
+
+class FixedTimeProvider:
+    def now(self) -> datetime.datetime:
+        return datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _lines(*lines: str):
+    for line in lines:
+        yield line
+
+
+@pytest.fixture
+def import_uow(fake_uow):
+    fake_uow.users.import_many = AsyncMock(return_value=[])
+    return fake_uow
+
+
+@pytest.mark.asyncio
+class TestUserImportService:
+    async def test_iter_text_lines_splits_across_chunks(self):
+        lines = [line async for line in iter_text_lines(_chunks(b'a,b\r\n1,', b'2\n3,4'))]
+        assert lines == ['a,b', '1,2', '3,4']
+
+    async def test_csv_rows_are_chunked(self, import_uow):
+        service = UserImportService(import_uow, ImportHasher(), FixedTimeProvider(), chunk_size=2)
+
+        report = await service.import_stream(
+            _lines(
+                'first_name,last_name,email,username,hashed_password,role',
+                'A,B,A@Example.com ,a,$argon2id$x,admin',
+                'C,D,c@example.com,c,$argon2id$y,',
+                'E,F,e@example.com,e,$argon2id$z,user',
+            ),
+            UserDataFormat.CSV,
+        )
+
+        assert report.imported == 3
+        assert report.rejected == 0
+        assert import_uow.users.import_many.await_count == 2
+        first_chunk = import_uow.users.import_many.await_args_list[0].args[0]
+        assert first_chunk[0].email == 'a@example.com'
+        assert first_chunk[0].role is UserRole.ADMIN
+        assert first_chunk[1].role is UserRole.USER
+        assert first_chunk[0].created_at == FixedTimeProvider().now()
+
+    async def test_quoted_csv_fields_may_span_lines(self, import_uow):
+        service = UserImportService(import_uow, ImportHasher(), FixedTimeProvider())
+
+        report = await service.import_stream(
+            _lines(
+                'first_name,last_name,email,username,hashed_password',
+                '"Anna','Maria",B,a@example.com,a,$argon2id$x',
+                '',
+                'C,D,c@example.com,c,plain',
+            ),
+            UserDataFormat.CSV,
+        )
+
+        assert report.imported == 1
+        imported = import_uow.users.import_many.await_args.args[0]
+        assert [(record.line_no, record.first_name) for record in imported] == [
+            (2, 'Anna\nMaria'),
+        ]
+        assert [error.line_no for error in report.errors] == [5]
+
+    async def test_unterminated_quote_is_rejected_without_buffering_the_rest(self, import_uow):
+        service = UserImportService(
+            import_uow,
+            ImportHasher(),
+            FixedTimeProvider(),
+            max_csv_record_length=64,
+        )
+
+        report = await service.import_stream(
+            _lines(
+                'first_name,last_name,email,username,hashed_password',
+                '"Anna,B,a@example.com,a,$argon2id$x',
+                'C,D,c@example.com,c,$argon2id$y',
+                'E,F,e@example.com,e,$argon2id$z',
+            ),
+            UserDataFormat.CSV,
+        )
+
+        assert report.rejected == 1
+        assert report.errors[0].line_no == 2
+        imported = import_uow.users.import_many.await_args.args[0]
+        assert [(record.line_no, record.email) for record in imported] == [(4, 'e@example.com')]
+
+    async def test_invalid_rows_are_reported_per_line(self, import_uow):
+        service = UserImportService(import_uow, ImportHasher(), FixedTimeProvider())
+
+        report = await service.import_stream(
+            _lines(
+                '{"first_name": "A", "last_name": "B", "email": "a@x.io", "username": "a", "hashed_password": "plain"}',
+                'not json',
+                '{"first_name": "C", "last_name": "D", "email": "c@x.io", "username": "c", "hashed_password": "$argon2id$x"}',
+            ),
+            UserDataFormat.NDJSON,
+        )
+
+        assert report.imported == 1
+        assert report.rejected == 2
+        assert [(error.line_no, error.field) for error in report.errors] == [
+            (1, 'hashed_password'),
+            (2, None),
+        ]
+
+    async def test_conflicts_from_repository_are_reported(self, import_uow):
+        import_uow.users.import_many.return_value = [
+            UserImportRowError(line_no=2, reason=UserImportErrorReason.ALREADY_EXISTS, field='email'),
+            UserImportRowError(line_no=2, reason=UserImportErrorReason.ALREADY_EXISTS, field='username'),
+        ]
+        service = UserImportService(import_uow, ImportHasher(), FixedTimeProvider(), max_reported_errors=1)
+        row = '{"first_name": "A", "last_name": "B", "email": "%s", "username": "%s", "hashed_password": "$argon2id$x", "id": "%s"}'
+
+        report = await service.import_stream(
+            _lines(row % ('a@x.io', 'a', uuid.uuid4()), row % ('b@x.io', 'b', uuid.uuid4())),
+            UserDataFormat.NDJSON,
+        )
+
+        assert report.imported == 1
+        assert report.rejected == 1
+        assert len(report.errors) == 1
+        assert report.errors_truncated is True